@@ -9,6 +9,7 @@ from otteroad.consumer.handlers.base import EventT
 from otteroad.models.scenario_events.projects.BaseScenarioCreated import BaseScenarioCreated
 
 from landuse_app.logic.helpers.indicators_service import IndicatorsService
+from landuse_app.logic.helpers.scenario_cache_service import ScenarioCacheService
 from landuse_app.logic.helpers.urban_api_access import UrbanAPIAccess
 
 
@@ -27,13 +28,14 @@ class BaseScenarioCreatedHandler(BaseMessageHandler[BaseScenarioCreated]):
             renovation: RenovationCalculator,
             producer: Producer,
             urban_api: UrbanAPIAccess,
-            indicators: IndicatorsService
-
+            indicators: IndicatorsService,
+            scenario_cache: ScenarioCacheService | None = None,
     ):
         self.renovation = renovation
         self.producer = producer
         self.urban_api = urban_api
         self.indicators = indicators
+        self.scenario_cache = scenario_cache
         super().__init__()
 
     async def on_startup(self):
@@ -51,6 +53,9 @@ class BaseScenarioCreatedHandler(BaseMessageHandler[BaseScenarioCreated]):
         )
 
         try:
+            if self.scenario_cache is not None:
+                await self.scenario_cache.refresh(event.base_scenario_id)
+
             logger.info(
                 f"Started project area calculation for {event.base_scenario_id}"
             )
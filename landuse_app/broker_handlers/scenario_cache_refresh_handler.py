@@ -0,0 +1,43 @@
+from confluent_kafka import Message
+from loguru import logger
+from otteroad import BaseMessageHandler
+from otteroad.consumer.handlers.base import EventT
+
+from landuse_app.logic.helpers.scenario_cache_service import ScenarioCacheService
+
+
+class ScenarioCacheRefreshHandler(BaseMessageHandler[EventT]):
+    """
+    Invalidates the cached data of the scenario named by an event and warms it up again.
+
+    One instance is registered per event type, e.g. ScenarioObjectsUpdated and
+    ScenarioZonesUpdated, since every such event carries `scenario_id` and `project_id`.
+    """
+
+    def __init__(self, event_type: type[EventT], scenario_cache: ScenarioCacheService):
+        self._event_type = event_type
+        self.scenario_cache = scenario_cache
+        super().__init__()
+
+    async def on_startup(self):
+        pass
+
+    async def on_shutdown(self):
+        pass
+
+    async def handle(self, event: EventT, ctx: Message = None):
+        logger.info(
+            f"Received {type(event).__name__} for scenario {event.scenario_id}, "
+            f"project {event.project_id}"
+        )
+        try:
+            await self.scenario_cache.refresh(event.scenario_id)
+        except Exception:
+            logger.exception(
+                "Kafka message processing failed, skipping message",
+                extra={
+                    "scenario_id": event.scenario_id,
+                    "project_id": event.project_id,
+                    "event_type": type(event).__name__,
+                },
+            )
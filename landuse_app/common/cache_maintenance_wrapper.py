@@ -0,0 +1,41 @@
+import asyncio
+
+from loguru import logger
+
+from storage.caching import CachingService
+
+
+class CacheMaintenanceWrapper:
+    """Lifespan-managed background task that periodically runs cache maintenance."""
+
+    def __init__(self, caching_service: CachingService, interval: float = 600.0):
+        self.caching_service = caching_service
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.caching_service.run_maintenance)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Cache maintenance failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def start(self) -> None:
+        if not self.caching_service.cache_enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Cache maintenance started (interval={self.interval}s)")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Cache maintenance stopped")
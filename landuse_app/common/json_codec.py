@@ -0,0 +1,30 @@
+"""
+JSON codec shared by the Urban API client and the cache.
+
+Uses orjson when it is installed and falls back to the standard library otherwise.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: bytes | str):
+    """Decodes a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Encodes an object to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
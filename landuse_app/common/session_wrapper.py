@@ -0,0 +1,78 @@
+import aiohttp
+from loguru import logger
+
+from landuse_app.config import config_number
+
+
+class SessionWrapper:
+    """Lifespan-managed pooled aiohttp session shared by all outbound HTTP clients."""
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        dns_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+        total_timeout: float = 600.0,
+        connect_timeout: float = 10.0,
+        read_timeout: float | None = None,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(
+            total=total_timeout, connect=connect_timeout, sock_read=read_timeout
+        )
+        self._session: aiohttp.ClientSession | None = None
+
+    @classmethod
+    def from_config(cls, config) -> "SessionWrapper":
+        return cls(
+            limit=config_number(config, "HTTP_POOL_LIMIT", 100),
+            limit_per_host=config_number(config, "HTTP_POOL_LIMIT_PER_HOST", 20),
+            dns_ttl=config_number(config, "HTTP_DNS_CACHE_TTL", 300),
+            keepalive_timeout=config_number(config, "HTTP_KEEPALIVE_TIMEOUT", 30.0, float),
+            total_timeout=config_number(config, "HTTP_TOTAL_TIMEOUT", 600.0, float),
+            connect_timeout=config_number(config, "HTTP_CONNECT_TIMEOUT", 10.0, float),
+            read_timeout=config_number(config, "HTTP_READ_TIMEOUT", None, float),
+        )
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.timeout,
+            headers={"Accept-Encoding": "gzip, deflate"},
+        )
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared session. It is opened lazily if the app lifespan
+        has not started it yet (e.g. when services are used from scripts).
+        """
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    async def start(self) -> None:
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+            logger.info(
+                f"HTTP session pool started (limit={self.limit}, "
+                f"limit_per_host={self.limit_per_host})"
+            )
+
+    async def stop(self) -> None:
+        """Close the pooled session and release all open connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("HTTP session pool closed")
+        self._session = None
@@ -1,12 +1,32 @@
 import os
+import threading
 from pathlib import Path
 
 from dotenv import load_dotenv
 
 
+def config_value(config, key: str, default=None):
+    """
+    Reads an optional setting from a config object, falling back to `default` if unset.
+    iduconfig's `Config.get` raises ValueError for unset keys instead of returning None.
+    """
+    try:
+        value = config.get(key)
+    except ValueError:
+        return default
+    return value if value not in (None, "") else default
+
+
+def config_number(config, key: str, default, cast=int):
+    """Reads a numeric setting from a config object, falling back to `default` if unset."""
+    value = config_value(config, key)
+    return cast(value) if value is not None else default
+
+
 class ConfigUtils:
     def __init__(self):
         self.env_path = Path().absolute() / f".env.{os.getenv('APP_ENV')}"
+        self._write_lock = threading.Lock()
         load_dotenv(self.env_path)
         print(f"Loaded .env.{os.getenv('APP_ENV')}")
         print(os.getenv("KAFKA_GROUP_ID"))
@@ -19,14 +39,20 @@ class ConfigUtils:
         return val is not None and val.lower() in ("true", "1", "yes")
 
     def set(self, key: str, value: str) -> None:
-        os.environ[key] = value
-        text = self.env_path.read_text() if self.env_path.exists() else ""
-        lines = text.splitlines()
-        prefix = f"{key}="
-        for i, line in enumerate(lines):
-            if line.startswith(prefix):
-                lines[i] = f"{key}={value}"
-                break
-        else:
-            lines.append(f"{key}={value}")
-        self.env_path.write_text("\n".join(lines) + "\n")
+        self.set_many({key: value})
+
+    def set_many(self, values: dict[str, str]) -> None:
+        """Sets several variables and rewrites the .env file once."""
+        with self._write_lock:
+            os.environ.update(values)
+            text = self.env_path.read_text() if self.env_path.exists() else ""
+            lines = text.splitlines()
+            for key, value in values.items():
+                prefix = f"{key}="
+                for i, line in enumerate(lines):
+                    if line.startswith(prefix):
+                        lines[i] = f"{key}={value}"
+                        break
+                else:
+                    lines.append(f"{key}={value}")
+            self.env_path.write_text("\n".join(lines) + "\n")
@@ -1,17 +1,26 @@
 from pathlib import Path
 
 from landuse_app.broker_handlers.base_scenario_created_handler import BaseScenarioCreatedHandler
+from landuse_app.broker_handlers.scenario_cache_refresh_handler import ScenarioCacheRefreshHandler
+from landuse_app.common import json_codec
+from landuse_app.common.cache_maintenance_wrapper import CacheMaintenanceWrapper
 from landuse_app.common.consumer_wrapper import ConsumerWrapper
 from landuse_app.common.producer_wrapper import ProducerWrapper
+from landuse_app.common.session_wrapper import SessionWrapper
 from loguru import logger
 from iduconfig import Config
+from otteroad.models.scenario_events.projects.ScenarioObjectsUpdated import ScenarioObjectsUpdated
+from otteroad.models.scenario_events.projects.ScenarioZonesUpdated import ScenarioZonesUpdated
 
-from landuse_app.config import ConfigUtils
+from landuse_app.config import ConfigUtils, config_number, config_value
+from landuse_app.logic.api.paginator import AdaptivePaginator
+from landuse_app.logic.api.resilience import CircuitBreaker, EndpointTimeouts, RetryPolicy
 from landuse_app.logic.api.urban_db_api_client import RequestHandler, AuthService
 from landuse_app.logic.helpers.indicators_service import IndicatorsService
 from landuse_app.logic.helpers.interpretation_service import InterpretationService
 from landuse_app.logic.helpers.preprocessing_service import PreProcessingService
 from landuse_app.logic.helpers.renovation_potential import RenovationPotential
+from landuse_app.logic.helpers.scenario_cache_service import ScenarioCacheService
 from landuse_app.logic.helpers.spatial_methods import SpatialMethods
 from landuse_app.logic.helpers.territories_urbanization import TerritoriesUrbanization
 from landuse_app.logic.helpers.urban_api_access import UrbanAPIAccess
@@ -28,24 +37,80 @@ logger.add(
 
 
 cache_enabled = bool(config.get("CACHE_ENABLED"))
-caching_service = CachingService(Path().absolute() / "__landuse_cache__", cache_enabled)
+cache_max_size_mb = config_number(config, "CACHE_MAX_SIZE_MB", None)
+caching_service = CachingService(
+    Path().absolute() / "__landuse_cache__",
+    cache_enabled,
+    memory_max_bytes=config_number(config, "MEMORY_CACHE_MAX_MB", 256) * 1024 * 1024,
+    max_disk_bytes=cache_max_size_mb * 1024 * 1024 if cache_max_size_mb is not None else None,
+    eviction_policy=config_value(config, "CACHE_EVICTION_POLICY", "lru").lower(),
+    soft_ttl=config_number(config, "CACHE_SOFT_TTL", None, float),
+    hard_ttl=config_number(config, "CACHE_HARD_TTL", None, float),
+    lease_timeout=config_number(config, "CACHE_LEASE_TIMEOUT", 600.0, float),
+)
+cache_maintenance = CacheMaintenanceWrapper(
+    caching_service, config_number(config, "CACHE_MAINTENANCE_INTERVAL", 600.0, float)
+)
+
+http_session = SessionWrapper.from_config(config)
 
 utilscofig = ConfigUtils()
-auth_service = AuthService(config.get("AUTH_SERVICE_URL"), config, utilscofig)
-requests_handler = RequestHandler(config.get("URBAN_API"), auth_service, caching_service)
+auth_service = AuthService(
+    config.get("AUTH_SERVICE_URL"),
+    config,
+    utilscofig,
+    http_session,
+    expiry_margin=config_number(config, "TOKEN_EXPIRY_MARGIN", 60.0, float),
+)
+requests_handler = RequestHandler(
+    config.get("URBAN_API"),
+    auth_service,
+    http_session,
+    caching_service,
+    retry_policy=RetryPolicy.from_config(config),
+    timeouts=EndpointTimeouts.from_config(config),
+    breaker=CircuitBreaker.from_config("Urban API", config),
+)
 
-urban_api = UrbanAPIAccess(requests_handler, config)
+paginator = AdaptivePaginator.from_config(requests_handler, config)
+urban_api = UrbanAPIAccess(requests_handler, config, paginator)
 
 spatial_methods = SpatialMethods()
 indicators_service = IndicatorsService(urban_api, spatial_methods)
 interpretation_service = InterpretationService()
-preprocessing_service = PreProcessingService(urban_api)
-renovation_potential = RenovationPotential(caching_service, interpretation_service, urban_api, preprocessing_service)
+preprocessing_service = PreProcessingService(
+    urban_api,
+    pipeline_queue_size=config_number(config, "PIPELINE_QUEUE_SIZE", 4),
+    caching=caching_service,
+    storeys_imputation=config_value(config, "STOREYS_IMPUTATION", "object_id").lower(),
+    area_classes=json_codec.loads(config_value(config, "PHYSICAL_OBJECT_AREA_CLASSES", "null")),
+)
+renovation_potential = RenovationPotential(
+    caching_service,
+    interpretation_service,
+    urban_api,
+    preprocessing_service,
+    content_addressed=utilscofig.get_bool("CACHE_CONTENT_ADDRESSED"),
+)
 territory_urbanization = TerritoriesUrbanization(caching_service, urban_api, preprocessing_service, renovation_potential)
 
+scenario_cache = ScenarioCacheService(
+    caching_service,
+    renovation_potential,
+    warm_up=utilscofig.get_bool("CACHE_WARM_UP_ON_EVENTS"),
+)
+
 consumer = ConsumerWrapper()
 producer = ProducerWrapper()
 
 consumer.register_handler(
-    BaseScenarioCreatedHandler(renovation_potential, producer.producer_service, urban_api, indicators_service)
+    BaseScenarioCreatedHandler(
+        renovation_potential,
+        producer.producer_service,
+        urban_api,
+        indicators_service,
+        scenario_cache,
+    )
 )
+consumer.register_handler(ScenarioCacheRefreshHandler(ScenarioObjectsUpdated, scenario_cache))
+consumer.register_handler(ScenarioCacheRefreshHandler(ScenarioZonesUpdated, scenario_cache))
@@ -1,7 +1,12 @@
 """health_check handler is defined here."""
 
+import asyncio
+
 from fastapi.responses import FileResponse
 
+from landuse_app.common import json_codec
+from landuse_app.dependencies import caching_service, preprocessing_service, requests_handler
+
 from .. import config
 from ..exceptions.http_exception_wrapper import http_exception
 from .routers import system_router
@@ -18,6 +23,26 @@ async def health_check():
     return {"status": "ok"}
 
 
+@system_router.get(
+    "/stats",
+    response_model=dict,
+)
+async def get_stats():
+    """
+    Return runtime statistics of the service: disk and memory cache tiers, the
+    Urban API client and geometry repairs per data source.
+    """
+    cache = await asyncio.to_thread(caching_service.stats)
+    return {
+        "cache": cache,
+        "urban_api": {
+            "coalesced_requests": requests_handler.coalesced_requests,
+            "json_backend": json_codec.BACKEND,
+        },
+        "geometry_repairs": preprocessing_service.geometry_repair_stats(),
+    }
+
+
 @system_router.get("/logs")
 async def get_logs():
     """
@@ -0,0 +1,229 @@
+import asyncio
+import math
+import time
+
+from loguru import logger
+
+from landuse_app.config import config_number
+from landuse_app.logic.api.urban_db_api_client import RequestHandler
+
+
+class AIMDLimiter:
+    """
+    Concurrency limiter with additive-increase / multiplicative-decrease control.
+
+    The limit grows by roughly one slot per fully used window while requests are fast
+    and succeed, and is cut by `decrease_factor` on errors or slow responses.
+    """
+
+    def __init__(
+        self,
+        initial: int = 5,
+        minimum: int = 1,
+        maximum: int = 16,
+        target_latency: float = 10.0,
+        decrease_factor: float = 0.5,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.target_latency = target_latency
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> "AIMDLimiter":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self, latency: float) -> None:
+        if latency > self.target_latency:
+            self._decrease()
+        else:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+    def on_error(self) -> None:
+        self._decrease()
+
+    def _decrease(self) -> None:
+        self.limit = max(self.minimum, self.limit * self.decrease_factor)
+
+
+class AdaptivePaginator:
+    """
+    Fetches Urban API endpoints paginated with `page`/`page_size` and answering with
+    `count`/`results`.
+
+    The first page is requested once and reused, the remaining pages are fetched under an
+    AIMD concurrency limit, failed pages are retried in extra rounds, and the page size for
+    the next fetch of the same endpoint is tuned so a page takes about `target_latency`.
+
+    `page_size` is part of the raw-response cache key, so the tuned size only moves along a
+    fixed ladder (the default size doubled or halved within the bounds) and only when a page
+    is at least twice as slow or as fast as the target; repeated fetches keep the same size
+    and hit the cached pages.
+    """
+
+    def __init__(
+        self,
+        requests_handler: RequestHandler,
+        limiter: AIMDLimiter | None = None,
+        default_page_size: int = 5000,
+        min_page_size: int = 500,
+        max_page_size: int = 20000,
+        target_latency: float = 10.0,
+        retry_rounds: int = 2,
+    ):
+        self.requests_handler = requests_handler
+        self.limiter = limiter or AIMDLimiter(target_latency=target_latency * 2)
+        self.default_page_size = default_page_size
+        self.min_page_size = min_page_size
+        self.max_page_size = max_page_size
+        self.target_latency = target_latency
+        self.retry_rounds = retry_rounds
+        self._page_sizes: dict[str, int] = {}
+        self._page_size_steps = self._build_page_size_steps()
+
+    @classmethod
+    def from_config(cls, requests_handler: RequestHandler, config) -> "AdaptivePaginator":
+        target_latency = config_number(config, "PAGE_TARGET_LATENCY", 10.0, float)
+        limiter = AIMDLimiter(
+            initial=config_number(config, "PAGINATION_CONCURRENCY", 5),
+            minimum=config_number(config, "PAGINATION_MIN_CONCURRENCY", 1),
+            maximum=config_number(config, "PAGINATION_MAX_CONCURRENCY", 16),
+            target_latency=target_latency * 2,
+        )
+        return cls(
+            requests_handler,
+            limiter=limiter,
+            default_page_size=config_number(config, "PAGE_SIZE", 5000),
+            min_page_size=config_number(config, "PAGE_SIZE_MIN", 500),
+            max_page_size=config_number(config, "PAGE_SIZE_MAX", 20000),
+            target_latency=target_latency,
+            retry_rounds=config_number(config, "PAGE_RETRY_ROUNDS", 2),
+        )
+
+    def page_size_for(self, endpoint: str) -> int:
+        return self._page_sizes.get(endpoint, self.default_page_size)
+
+    def _build_page_size_steps(self) -> list[int]:
+        default = min(self.max_page_size, max(self.min_page_size, self.default_page_size))
+        steps = [default]
+        while steps[0] // 2 >= self.min_page_size:
+            steps.insert(0, steps[0] // 2)
+        while steps[-1] * 2 <= self.max_page_size:
+            steps.append(steps[-1] * 2)
+        return steps
+
+    def _learn_page_size(self, endpoint: str, page_size: int, latency: float) -> None:
+        """
+        Moves the endpoint's page size one step along the ladder towards the target latency.
+        Near-instant responses are most likely cache hits and say nothing about the upstream.
+        """
+        if latency < self.target_latency * 0.05:
+            return
+        current = self.page_size_for(endpoint)
+        if current not in self._page_size_steps:
+            current = min(self._page_size_steps, key=lambda step: abs(step - current))
+        index = self._page_size_steps.index(current)
+        ideal = page_size * self.target_latency / max(latency, 1e-3)
+        if ideal >= current * 2 and index + 1 < len(self._page_size_steps):
+            index += 1
+        elif ideal <= current / 2 and index > 0:
+            index -= 1
+        self._page_sizes[endpoint] = self._page_size_steps[index]
+
+    async def _fetch_page(
+        self, endpoint: str, params: dict, page: int, page_size: int
+    ) -> dict:
+        async with self.limiter:
+            started = time.monotonic()
+            try:
+                data = await self.requests_handler.get(
+                    endpoint, params={**params, "page": page, "page_size": page_size}
+                )
+            except Exception:
+                self.limiter.on_error()
+                raise
+            latency = time.monotonic() - started
+            self.limiter.on_success(latency)
+        self._learn_page_size(endpoint, page_size, latency)
+        logger.info(
+            f"Page {page} of {endpoint} has been loaded in {latency:.2f}s "
+            f"(concurrency limit {int(self.limiter.limit)})"
+        )
+        return data
+
+    async def iter_pages(self, endpoint: str, params: dict = None):
+        """
+        Yields `(page_number, results)` for every page as soon as it is downloaded,
+        in completion order.
+
+        New pages are only requested while the consumer keeps pulling, and no more than
+        the current concurrency limit are outstanding, so a slow consumer applies
+        backpressure to the downloads.
+
+        Raises:
+            Exception: The last error of a page that still fails after all retry rounds.
+        """
+        params = params or {}
+        page_size = self.page_size_for(endpoint)
+        first_page = await self._fetch_page(endpoint, params, 1, page_size)
+        total = first_page.get("count", 0)
+        total_pages = math.ceil(total / page_size) if total else 1
+        logger.info(
+            f"Total objects on {endpoint}: {total}, page size: {page_size}, "
+            f"total number of pages: {total_pages}"
+        )
+        yield 1, first_page.get("results", [])
+
+        pending = list(range(2, total_pages + 1))
+        last_error: BaseException | None = None
+        for round_number in range(self.retry_rounds + 1):
+            if not pending:
+                return
+            tasks: dict[asyncio.Task, int] = {}
+            failed = []
+            try:
+                while pending or tasks:
+                    while pending and len(tasks) < max(1, int(self.limiter.limit)):
+                        page = pending.pop(0)
+                        task = asyncio.create_task(
+                            self._fetch_page(endpoint, params, page, page_size)
+                        )
+                        tasks[task] = page
+                    done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        page = tasks.pop(task)
+                        if task.exception() is not None:
+                            failed.append(page)
+                            last_error = task.exception()
+                            continue
+                        yield page, task.result().get("results", [])
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            pending = sorted(failed)
+            if pending:
+                logger.warning(
+                    f"{len(pending)} of {total_pages} pages of {endpoint} failed "
+                    f"on round {round_number + 1}"
+                )
+
+        if pending:
+            raise last_error
+
+    async def fetch_all(self, endpoint: str, params: dict = None) -> list[dict]:
+        """Collects the results of all pages in page order."""
+        pages = {}
+        async for page, results in self.iter_pages(endpoint, params):
+            pages[page] = results
+        return [item for page in sorted(pages) for item in pages[page]]
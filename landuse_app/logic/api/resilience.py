@@ -0,0 +1,185 @@
+import asyncio
+import random
+import re
+import time
+from dataclasses import dataclass, field
+
+import aiohttp
+from fastapi import HTTPException
+from loguru import logger
+
+from landuse_app.config import config_number, config_value
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry settings for idempotent Urban API requests (delays in seconds)."""
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 10.0
+    deadline: float = 300.0
+
+    @classmethod
+    def from_config(cls, config) -> "RetryPolicy":
+        return cls(
+            max_attempts=config_number(config, "URBAN_API_MAX_ATTEMPTS", 3),
+            backoff_base=config_number(config, "URBAN_API_BACKOFF_BASE", 0.5, float),
+            backoff_max=config_number(config, "URBAN_API_BACKOFF_MAX", 10.0, float),
+            deadline=config_number(config, "URBAN_API_DEADLINE", 300.0, float),
+        )
+
+    def deadline_for(self, attempt_timeout: float) -> float:
+        """
+        Retry deadline of a request whose attempts time out after `attempt_timeout`.
+
+        The deadline is checked before every retry, so it bounds when the last attempt
+        may start, not how long that attempt runs. It is never shorter than one full
+        attempt plus the longest backoff; otherwise an attempt of a heavy endpoint that
+        runs into its timeout (URBAN_API_HEAVY_TIMEOUT exceeds the default deadline)
+        would never be retried.
+        """
+        return max(self.deadline, attempt_timeout + self.backoff_max)
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for the given (1-based) attempt."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+
+@dataclass(frozen=True)
+class EndpointTimeouts:
+    """
+    Per-endpoint request timeouts (seconds). `overrides` maps a regular expression
+    searched in the request path to a total timeout; the first match wins. Otherwise
+    endpoints returning geometries, which can be hundreds of MB, get `heavy` and the
+    rest `default`. Every read from the socket is bounded by `sock_read` as well.
+    """
+    default: float = 60.0
+    heavy: float = 600.0
+    sock_read: float = 120.0
+    overrides: dict[str, float] = field(default_factory=dict)
+
+    HEAVY_ENDPOINTS = (
+        r"geometries_with_all_objects",
+        r"physical_objects_with_geometry",
+        r"physical_objects_geojson",
+        r"/functional_zones",
+        r"services_geojson",
+    )
+
+    @classmethod
+    def from_config(cls, config) -> "EndpointTimeouts":
+        """
+        Reads URBAN_API_TIMEOUT, URBAN_API_HEAVY_TIMEOUT, URBAN_API_SOCK_READ_TIMEOUT and
+        URBAN_API_ENDPOINT_TIMEOUTS, the latter formatted as
+        "physical_objects_with_geometry=180,functional_zones=120".
+        """
+        overrides = {}
+        for item in config_value(config, "URBAN_API_ENDPOINT_TIMEOUTS", "").split(","):
+            if "=" in item:
+                pattern, value = item.split("=", 1)
+                overrides[pattern.strip()] = float(value)
+        return cls(
+            default=config_number(config, "URBAN_API_TIMEOUT", 60.0, float),
+            heavy=config_number(config, "URBAN_API_HEAVY_TIMEOUT", 600.0, float),
+            sock_read=config_number(config, "URBAN_API_SOCK_READ_TIMEOUT", 120.0, float),
+            overrides=overrides,
+        )
+
+    def for_path(self, path: str) -> float:
+        for pattern, timeout in self.overrides.items():
+            if re.search(pattern, path):
+                return timeout
+        if any(re.search(pattern, path) for pattern in self.HEAVY_ENDPOINTS):
+            return self.heavy
+        return self.default
+
+    def client_timeout(self, path: str) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(total=self.for_path(path), sock_read=self.sock_read)
+
+
+class CircuitBreaker:
+    """
+    Fails fast while the upstream is unhealthy.
+
+    After `failure_threshold` consecutive failures the breaker opens and rejects calls
+    for `reset_timeout` seconds, then lets a single trial call through (half-open).
+    A successful trial closes the breaker, a failed one opens it again.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @classmethod
+    def from_config(cls, name: str, config) -> "CircuitBreaker":
+        return cls(
+            name,
+            failure_threshold=config_number(config, "URBAN_API_BREAKER_THRESHOLD", 5),
+            reset_timeout=config_number(config, "URBAN_API_BREAKER_RESET", 30.0, float),
+        )
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> bool:
+        """
+        Raises 503 if the breaker is open or a half-open trial is already running.
+
+        Returns:
+            bool: whether this call is the half-open trial. The caller must pass it to
+            `end_call` in a `finally` block, so a cancelled trial does not keep the
+            breaker rejecting calls.
+        """
+        state = self.state
+        if state == "open" or (state == "half_open" and self._trial_in_flight):
+            raise HTTPException(503, f"{self.name} is temporarily unavailable")
+        if state == "half_open":
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def end_call(self, trial: bool) -> None:
+        """Releases the half-open trial slot taken by `before_call`, whatever the outcome."""
+        if trial:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        if self.opened_at is not None:
+            logger.info(f"Circuit breaker for {self.name} closed")
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            logger.warning(
+                f"Circuit breaker for {self.name} opened after {self.failures} failures"
+            )
+
+
+def is_retryable(error: Exception) -> bool:
+    """Transport errors, timeouts, 429 and 5xx responses are worth retrying."""
+    if isinstance(error, HTTPException):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+def as_http_exception(error: Exception, path: str) -> HTTPException:
+    """Converts transport errors into HTTPException so callers see a uniform error type."""
+    if isinstance(error, HTTPException):
+        return error
+    if isinstance(error, asyncio.TimeoutError):
+        return HTTPException(504, f"Urban API request timed out: {path}")
+    return HTTPException(502, f"Urban API request failed: {path}: {error}")
@@ -1,22 +1,58 @@
+import asyncio
+import contextlib
+import contextvars
 import logging
 import time
 
-import aiohttp
+import ijson
 import jwt
 from fastapi import HTTPException
 from iduconfig import Config
 
+from landuse_app.common import json_codec
+from landuse_app.common.session_wrapper import SessionWrapper
 from landuse_app.config import ConfigUtils
+from landuse_app.logic.api.resilience import (
+    CircuitBreaker,
+    EndpointTimeouts,
+    RetryPolicy,
+    as_http_exception,
+    is_retryable,
+)
+from landuse_app.logic.constants.cache_keys import URBAN_API_RESPONSE
 
 logger = logging.getLogger(__name__)
 
+# Set by `fresh_responses`: GETs skip reading the response cache
+_fresh_responses: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "fresh_responses", default=False
+)
+
+
+@contextlib.contextmanager
+def fresh_responses(enabled: bool = True):
+    """
+    Within the block, including tasks started in it, GET requests go to Urban API
+    instead of returning cached responses; the fresh responses are still cached.
+    """
+    if not enabled:
+        yield
+        return
+    token = _fresh_responses.set(True)
+    try:
+        yield
+    finally:
+        _fresh_responses.reset(token)
+
 
 class AuthService:
     def __init__(
         self,
         auth_base_url: str,
         iduconfig: Config,
-        utilsconfig: ConfigUtils
+        utilsconfig: ConfigUtils,
+        session: SessionWrapper,
+        expiry_margin: float = 60.0,
     ):
 
         self.introspect_url = f"{auth_base_url}/introspect/"
@@ -24,47 +60,52 @@ class AuthService:
         self.token_url = f"{auth_base_url}/token/"
         self.iduconfig = iduconfig
         self.utilsconfig = utilsconfig
+        self.session = session
+        self.expiry_margin = expiry_margin
+        self._access_token: str | None = None
+        self._access_exp: float = 0.0
+        self._refresh_token: str | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._persist_tasks: set[asyncio.Task] = set()
 
     async def _introspect(self, token: str) -> bool:
-        async with aiohttp.ClientSession() as sess:
-            payload = {
-                "token": token,
-                "token_type_hint": "access_token",
-                "client_id": "unknown_client",
-            }
-            headers = {
-                "accept": "application/json",
-                "Content-Type": "application/x-www-form-urlencoded",
-            }
-            async with sess.post(
-                self.introspect_url, data=payload, headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    return (await resp.json()).get("active", False)
-                logger.warning(
-                    "Introspect failed %s: %s", resp.status, await resp.text()
-                )
-                return False
+        payload = {
+            "token": token,
+            "token_type_hint": "access_token",
+            "client_id": "unknown_client",
+        }
+        headers = {
+            "accept": "application/json",
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+        async with self.session.session.post(
+            self.introspect_url, data=payload, headers=headers
+        ) as resp:
+            if resp.status == 200:
+                return (await resp.json()).get("active", False)
+            logger.warning(
+                "Introspect failed %s: %s", resp.status, await resp.text()
+            )
+            return False
 
     async def _refresh(self, refresh_token: str) -> dict:
-        async with aiohttp.ClientSession() as sess:
-            payload = {
-                "grant_type": "refresh_token",
-                "refresh_token": refresh_token,
-                "client_id": "unknown_client",
-            }
-            headers = {
-                "accept": "application/json",
-                "Content-Type": "application/x-www-form-urlencoded",
-            }
-            async with sess.post(
-                self.refresh_url, data=payload, headers=headers
-            ) as resp:
-                text = await resp.text()
-                if resp.status != 200:
-                    logger.error("Refresh token failed %s: %s", resp.status, text)
-                    raise HTTPException(401, f"Cannot refresh token: {text}")
-                return await resp.json()
+        payload = {
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+            "client_id": "unknown_client",
+        }
+        headers = {
+            "accept": "application/json",
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+        async with self.session.session.post(
+            self.refresh_url, data=payload, headers=headers
+        ) as resp:
+            text = await resp.text()
+            if resp.status != 200:
+                logger.error("Refresh token failed %s: %s", resp.status, text)
+                raise HTTPException(401, f"Cannot refresh token: {text}")
+            return await resp.json()
 
     async def _password_grant(self) -> dict:
         """
@@ -75,49 +116,106 @@ class AuthService:
         if not username or not password:
             raise HTTPException(500, "Missing AUTH_USERNAME/AUTH_PASSWORD in config")
 
-        async with aiohttp.ClientSession() as sess:
-            payload = {
-                "grant_type": "password",
-                "username": username,
-                "password": password,
-                "client_id": "unknown_client",
-            }
-            headers = {
-                "accept": "application/json",
-                "Content-Type": "application/x-www-form-urlencoded",
-            }
-            async with sess.post(self.token_url, data=payload, headers=headers) as resp:
-                text = await resp.text()
-                if resp.status != 200:
-                    logger.error("Password grant failed %s: %s", resp.status, text)
-                    raise HTTPException(401, f"Password grant error: {text}")
-                return await resp.json()
+        payload = {
+            "grant_type": "password",
+            "username": username,
+            "password": password,
+            "client_id": "unknown_client",
+        }
+        headers = {
+            "accept": "application/json",
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+        async with self.session.session.post(
+            self.token_url, data=payload, headers=headers
+        ) as resp:
+            text = await resp.text()
+            if resp.status != 200:
+                logger.error("Password grant failed %s: %s", resp.status, text)
+                raise HTTPException(401, f"Password grant error: {text}")
+            return await resp.json()
 
-    def _is_jwt_expired(self, token: str) -> bool:
+    @staticmethod
+    def _jwt_exp(token: str) -> float:
         try:
             payload = jwt.decode(token, options={"verify_signature": False})
-            return payload.get("exp", 0) < time.time()
+            return float(payload.get("exp", 0))
         except Exception:
-            return True
+            return 0.0
+
+    def _is_jwt_expired(self, token: str) -> bool:
+        return self._jwt_exp(token) < time.time()
+
+    def _cached_access_token(self) -> str | None:
+        """Returns the in-memory access token if it is valid for longer than the margin."""
+        if self._access_token and self._access_exp - self.expiry_margin > time.time():
+            return self._access_token
+        return None
+
+    def _remember_tokens(self, access: str, refresh: str, expires_in=None) -> None:
+        self._access_token = access
+        self._refresh_token = refresh
+        exp = self._jwt_exp(access)
+        if not exp and expires_in:
+            exp = time.time() + float(expires_in)
+        self._access_exp = exp
+
+    def _persist_tokens(self, tokens: dict) -> None:
+        """Writes new tokens to the .env file in a worker thread, off the request path."""
+        task = asyncio.create_task(
+            asyncio.to_thread(
+                self.utilsconfig.set_many,
+                {
+                    "ACCESS_TOKEN": tokens["access_token"],
+                    "REFRESH_TOKEN": tokens["refresh_token"],
+                },
+            )
+        )
+        self._persist_tasks.add(task)
+        task.add_done_callback(self._on_persist_done)
+
+    def _on_persist_done(self, task: asyncio.Task) -> None:
+        self._persist_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Failed to persist tokens: %s", task.exception())
 
     async def validate_and_refresh(self) -> str:
+        """
+        Returns a valid access token.
+
+        The token and its expiry are kept in memory, so no network call is made
+        until the token is about to expire. Concurrent callers share a single
+        in-flight refresh.
+        """
+        token = self._cached_access_token()
+        if token:
+            return token
+
+        async with self._refresh_lock:
+            token = self._cached_access_token()
+            if token:
+                return token
+            return await self._obtain_access_token()
+
+    async def _obtain_access_token(self) -> str:
         """
         1) If refresh_token expired — trying password grant.
         2) Otherwise, if access_token is not expired yet — introspect.
         3) If introspect return False or access token is expired — refresh.
         4) Setting new tokens and returning access_token.
         """
-        access = self.iduconfig.get("ACCESS_TOKEN") or ""
-        refresh = self.iduconfig.get("REFRESH_TOKEN") or ""
+        access = self._access_token or self.iduconfig.get("ACCESS_TOKEN") or ""
+        refresh = self._refresh_token or self.iduconfig.get("REFRESH_TOKEN") or ""
 
         if self._is_jwt_expired(refresh):
             logger.info("Local: refresh token expired, falling back to password grant")
             tokens = await self._password_grant()
 
         else:
-            if not self._is_jwt_expired(access):
+            if self._jwt_exp(access) - self.expiry_margin > time.time():
                 logger.info("Local: access token still valid, will introspect")
                 if await self._introspect(access):
+                    self._remember_tokens(access, refresh)
                     return access
                 logger.info("Introspect: access token inactive, will refresh")
 
@@ -132,17 +230,34 @@ class AuthService:
                 else:
                     raise
 
-        self.utilsconfig.set("ACCESS_TOKEN", tokens["access_token"])
-        self.utilsconfig.set("REFRESH_TOKEN", tokens["refresh_token"])
+        self._remember_tokens(
+            tokens["access_token"], tokens["refresh_token"], tokens.get("expires_in")
+        )
+        self._persist_tokens(tokens)
         logger.info("Tokens updated (expires_in=%s)", tokens.get("expires_in"))
         return tokens["access_token"]
 
 
 class RequestHandler:
-    def __init__(self, api_base: str, auth_service: AuthService, cache_service=None):
+    def __init__(
+        self,
+        api_base: str,
+        auth_service: AuthService,
+        session: SessionWrapper,
+        cache_service=None,
+        retry_policy: RetryPolicy | None = None,
+        timeouts: EndpointTimeouts | None = None,
+        breaker: CircuitBreaker | None = None,
+    ):
         self.url = api_base
         self.auth = auth_service
+        self.session = session
         self.cache = cache_service
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.timeouts = timeouts or EndpointTimeouts()
+        self.breaker = breaker or CircuitBreaker("Urban API")
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.coalesced_requests = 0
 
     async def _prepare_headers(
         self, use_token: bool = True, override_token: str | None = None
@@ -155,30 +270,159 @@ class RequestHandler:
             headers["Authorization"] = f"Bearer {token}"
         return headers
 
+    @staticmethod
+    def _request_key(path: str, params: dict | None, ignore_404: bool) -> str:
+        param_string = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        return f"{path}?{param_string}|{ignore_404}|{_fresh_responses.get()}"
+
+    def _forget_inflight(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # mark the exception as retrieved even if every waiter was cancelled
+            task.exception()
+
     async def get(
         self, path: str, params: dict = None, ignore_404: bool = False
     ) -> dict | None:
-        headers = await self._prepare_headers()
-        key = path.strip("/").replace("/", "_")
-        if self.cache:
-            recent = self.cache.get_recent_cache_file(key, params or {})
+        """
+        Async GET-request.
+
+        Identical concurrent requests (same path, params, ignore_404 flag and
+        `fresh_responses` mode) are coalesced: only the first one goes to Urban API,
+        the others await its result and receive the same response object or exception. The shared request runs
+        in its own task, so cancelling one waiter does not cancel it for the others.
+        """
+        key = self._request_key(path, params, ignore_404)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._get(path, params, ignore_404))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget_inflight(key, t))
+        else:
+            self.coalesced_requests += 1
+            logger.info(
+                "Coalesced GET %s with in-flight request (total coalesced: %s)",
+                path,
+                self.coalesced_requests,
+            )
+        return await asyncio.shield(task)
+
+    async def _get(
+        self, path: str, params: dict = None, ignore_404: bool = False
+    ) -> dict | None:
+        name, cache_params = URBAN_API_RESPONSE.key(
+            path=path.strip("/").replace("/", "_"), **(params or {})
+        )
+        if self.cache and not _fresh_responses.get():
+            # the index lookup is a blocking SQLite query
+            recent = await asyncio.to_thread(self.cache.get_recent_cache_file, name, cache_params)
             if recent and self.cache.is_cache_valid(recent):
                 logger.info("Using cache for %s", path)
-                return self.cache.load_cache(recent)
+                return await self.cache.load_cache_async(recent)
+
+        data = await self._get_with_retries(path, params, ignore_404)
+        if data is not None and self.cache:
+            self.cache.save_with_cleanup_background(
+                data, name, cache_params, URBAN_API_RESPONSE.artifact
+            )
+        return data
+
+    async def _get_with_retries(
+        self, path: str, params: dict = None, ignore_404: bool = False
+    ) -> dict | None:
+        """
+        Sends a GET-request, retrying transport errors, timeouts, 429 and 5xx responses
+        with exponential jittered backoff until the attempts or the call deadline run out.
+        The deadline covers at least one full attempt of the endpoint (see
+        `RetryPolicy.deadline_for`).
+        """
+        policy = self.retry_policy
+        deadline = time.monotonic() + policy.deadline_for(self.timeouts.for_path(path))
+        attempt = 0
+        while True:
+            attempt += 1
+            trial = self.breaker.before_call()
+            try:
+                data = await self._send_get(path, params, ignore_404)
+                self.breaker.record_success()
+                return data
+            except Exception as e:
+                if not is_retryable(e):
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                delay = policy.backoff(attempt)
+                if (
+                    attempt >= policy.max_attempts
+                    or time.monotonic() + delay > deadline
+                ):
+                    logger.error("GET %s failed after %s attempts: %s", path, attempt, e)
+                    raise as_http_exception(e, path) from e
+                logger.warning(
+                    "GET %s attempt %s failed (%s), retrying in %.2fs",
+                    path,
+                    attempt,
+                    e,
+                    delay,
+                )
+            finally:
+                self.breaker.end_call(trial)
+            await asyncio.sleep(delay)
+
+    async def _send_get(
+        self, path: str, params: dict = None, ignore_404: bool = False
+    ) -> dict | None:
+        headers = await self._prepare_headers()
+        url = f"{self.url}{path}"
+        timeout = self.timeouts.client_timeout(path)
+        async with self.session.session.get(
+            url, params=params, headers=headers, timeout=timeout
+        ) as resp:
+            if resp.status == 200:
+                return json_codec.loads(await resp.read())
+            if ignore_404 and resp.status == 404:
+                return None
+            text = await resp.text()
+            logger.error("GET %s failed: %s", path, text)
+            raise HTTPException(resp.status, f"Urban API GET error: {text}")
 
+    async def stream_items(
+        self, path: str, params: dict = None, item_path: str = "features"
+    ):
+        """
+        Async GET-request which decodes the JSON body incrementally from the socket.
+
+        Yields the elements of the `item_path` array (e.g. "features" or "results")
+        one by one as soon as they are parsed, so the raw body, the decoded string and
+        the full dict tree are never held in memory at the same time.
+        Streamed responses bypass the response cache and request coalescing.
+        """
+        headers = await self._prepare_headers()
         url = f"{self.url}{path}"
-        async with aiohttp.ClientSession() as sess:
-            async with sess.get(url, params=params, headers=headers) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    if self.cache:
-                        self.cache.save_with_cleanup(data, key, params or {})
-                    return data
-                if ignore_404 and resp.status == 404:
-                    return None
-                text = await resp.text()
-                logger.error("GET %s failed: %s", path, text)
-                raise HTTPException(resp.status, f"Urban API GET error: {text}")
+        timeout = self.timeouts.client_timeout(path)
+        trial = self.breaker.before_call()
+        try:
+            async with self.session.session.get(
+                url, params=params, headers=headers, timeout=timeout
+            ) as resp:
+                if resp.status != 200:
+                    text = await resp.text()
+                    logger.error("GET %s failed: %s", path, text)
+                    raise HTTPException(resp.status, f"Urban API GET error: {text}")
+                async for item in ijson.items_async(
+                    resp.content, f"{item_path}.item", use_float=True
+                ):
+                    yield item
+        except Exception as e:
+            if is_retryable(e):
+                self.breaker.record_failure()
+                raise as_http_exception(e, path) from e
+            self.breaker.record_success()
+            raise
+        finally:
+            self.breaker.end_call(trial)
+        self.breaker.record_success()
 
     async def put(
         self,
@@ -203,11 +447,27 @@ class RequestHandler:
             headers["Authorization"] = f"Bearer {token}"
 
         url = f"{self.url}{path}"
-        async with aiohttp.ClientSession() as sess:
-            async with sess.put(url, json=data, headers=headers) as resp:
+        timeout = self.timeouts.client_timeout(path)
+        trial = self.breaker.before_call()
+        try:
+            async with self.session.session.put(
+                url, json=data, headers=headers, timeout=timeout
+            ) as resp:
                 if resp.status in (200, 201):
-                    return await resp.json()
-                text = await resp.text()
-                logger.error("PUT %s failed: %s", path, text)
-                raise HTTPException(resp.status, f"Urban API PUT error: {text}")
+                    result = await resp.json()
+                else:
+                    text = await resp.text()
+                    logger.error("PUT %s failed: %s", path, text)
+                    raise HTTPException(resp.status, f"Urban API PUT error: {text}")
+        except Exception as e:
+            # PUT is not retried, but upstream failures still feed the breaker
+            if is_retryable(e):
+                self.breaker.record_failure()
+                raise as_http_exception(e, path) from e
+            self.breaker.record_success()
+            raise
+        finally:
+            self.breaker.end_call(trial)
+        self.breaker.record_success()
+        return result
 
@@ -0,0 +1,38 @@
+from storage.artifacts import ArtifactSpec, GeoDataFrameArtifact, JsonArtifact
+
+# Every cached artifact is declared here. Bump `version` when the producing code changes
+# the artifact's content, so entries written by the previous version are no longer read.
+
+# Raw Urban API GET responses; `path` is the endpoint path joined with underscores
+URBAN_API_RESPONSE = ArtifactSpec("{path}", JsonArtifact, version=1)
+
+# Functional zones with renovation potential of a project scenario
+SCENARIO_RENOVATION_POTENTIAL = ArtifactSpec(
+    "renovation_potential_project-{scenario_id}_is_context-{is_context}",
+    GeoDataFrameArtifact,
+    version=4,
+)
+
+# Functional zones with renovation potential and urbanization level of a territory
+TERRITORY_RENOVATION_POTENTIAL = ArtifactSpec(
+    "renovation_potential_territory-{territory_id}",
+    GeoDataFrameArtifact,
+    version=4,
+)
+
+# Renovation potential analysis keyed by a fingerprint of its inputs (functional zones,
+# physical objects and profile); used in content-addressed mode
+RENOVATION_POTENTIAL_BY_INPUT = ArtifactSpec(
+    "renovation_potential_input-{fingerprint}",
+    GeoDataFrameArtifact,
+    version=2,
+)
+
+# Parsed and filtered physical objects of a scenario, projected to a local UTM CRS with
+# their areas, shared by all scenario endpoints. Keyed by the scenario's data version,
+# which is bumped when the scenario changes.
+SCENARIO_PHYSICAL_OBJECTS = ArtifactSpec(
+    "physical_objects_scenario-{scenario_id}_is_context-{is_context}",
+    GeoDataFrameArtifact,
+    version=6,
+)
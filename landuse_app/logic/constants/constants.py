@@ -1,3 +1,5 @@
+from typing import Any, NamedTuple
+
 DEFAULT_RESIDENTIAL = {
     "functional_zone_type": {"id": 1, "name": "residential", "nickname": "Жилая зона"},
     "zone_type_id": 1,
@@ -106,6 +108,47 @@ ZONE_CLASS_BY_ID = {
     14: "Unknown",
 }
 
+
+class NestedField(NamedTuple):
+    """A value nested in feature properties, flattened into a column of the given dtype."""
+
+    path: tuple[str, ...]
+    dtype: str | None = None
+    default: Any = None
+
+
+# Classes of physical objects whose areas (m²) are summed up in preprocessing, by
+# physical object type ids. A type may belong to several classes.
+PHYSICAL_OBJECT_AREA_CLASSES = {
+    "water_objects": (45, 2, 44),
+    "green_objects": (47, 3),
+    "forests": (48,),
+}
+
+# Nested properties of functional zones flattened into columns
+FUNCTIONAL_ZONE_FIELDS = {
+    "zone_type_id": NestedField(("functional_zone_type", "id"), "Int64"),
+    "zone_type_name": NestedField(("functional_zone_type", "name")),
+    "zone_type_nickname": NestedField(("functional_zone_type", "nickname")),
+}
+
+TERRITORY_FUNCTIONAL_ZONE_FIELDS = {
+    "zone_type_id": NestedField(("functional_zone_type", "id"), "Int64"),
+    "zone_type_nickname": NestedField(("functional_zone_type", "nickname")),
+    "zone_type_parent_territory_id": NestedField(("territory", "id"), "Int64"),
+    "zone_type_parent_territory_name": NestedField(("territory", "name")),
+}
+
+LANDUSE_ZONE_FIELD = {"landuse_zone": NestedField(("properties", "landuse_zon"))}
+
+# Nested properties of services flattened into columns
+SERVICE_FIELDS = {
+    "service_name": NestedField(("name",)),
+    "capacity": NestedField(("capacity",)),
+    "service_type_id": NestedField(("service_type", "service_type_id"), "Int64"),
+    "service_type_name": NestedField(("service_type", "name")),
+}
+
 LAND_CATEGORY_NAME_TO_ID = {
     "Земли жилой застройки": 17,
     "Земли сельскохозяйственного назначения": 20,
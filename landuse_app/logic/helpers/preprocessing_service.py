@@ -1,56 +1,249 @@
-import random
+import asyncio
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 from loguru import logger
-from shapely.geometry import shape
 
+from storage.caching import CachingService
+from .spatial_methods import SpatialMethods
 from .urban_api_access import UrbanAPIAccess
 from ...exceptions.http_exception_wrapper import http_exception
-from ..constants.constants import ZONE_CLASS_BY_ID
+from ..constants.cache_keys import SCENARIO_PHYSICAL_OBJECTS
+from ..constants.constants import (
+    FUNCTIONAL_ZONE_FIELDS,
+    LANDUSE_ZONE_FIELD,
+    PHYSICAL_OBJECT_AREA_CLASSES,
+    SERVICE_FIELDS,
+    TERRITORY_FUNCTIONAL_ZONE_FIELDS,
+    ZONE_CLASS_BY_ID,
+    NestedField,
+)
 
 
 class PreProcessingService:
-    def __init__(self, urban_db_api: UrbanAPIAccess):
+    # Ways to fill in storeys of buildings without floor data, see `impute_storeys`
+    STOREYS_IMPUTATION_STRATEGIES = ("object_id", "median")
+    DEFAULT_STOREYS = 3
+
+    def __init__(
+        self,
+        urban_db_api: UrbanAPIAccess,
+        pipeline_queue_size: int = 4,
+        caching: CachingService | None = None,
+        storeys_imputation: str = "object_id",
+        area_classes: dict[str, tuple[int, ...]] | None = None,
+    ):
+        if storeys_imputation not in self.STOREYS_IMPUTATION_STRATEGIES:
+            raise ValueError(
+                f"Unknown storeys imputation strategy {storeys_imputation!r}, "
+                f"expected one of {self.STOREYS_IMPUTATION_STRATEGIES}"
+            )
         self.urban_db_api = urban_db_api
+        self.pipeline_queue_size = pipeline_queue_size
+        self.caching = caching
+        self.storeys_imputation = storeys_imputation
+        self.area_classes = area_classes or PHYSICAL_OBJECT_AREA_CLASSES
+        self.geometry_repairs: dict[str, dict[str, int]] = {}
+
+    def _record_repairs(self, label: str, report: dict[str, int]) -> None:
+        """Adds a repair report of one batch to the running counters of its source."""
+        if not report["invalid"]:
+            return
+        totals = self.geometry_repairs.setdefault(label, dict.fromkeys(report, 0))
+        for counter, value in report.items():
+            totals[counter] += value
+        logger.info(
+            f"Repaired {label} geometries: {report['invalid']} invalid, "
+            f"{report['repaired']} repaired, {report['dropped']} dropped, "
+            f"{report['type_changed']} changed type"
+        )
+
+    def geometry_repair_stats(self) -> dict[str, dict[str, int]]:
+        """Geometry repair counters accumulated since start, per data source."""
+        return {label: dict(totals) for label, totals in self.geometry_repairs.items()}
+
+    @staticmethod
+    def _parse_geometries(
+        features: list[dict], id_field: str, label: str
+    ) -> tuple[np.ndarray, dict[str, int]]:
+        """
+        Parses and repairs the geometries of GeoJSON features in one vectorized pass.
+
+        Features whose geometry cannot be parsed get None and are logged with the value of
+        `id_field` from their properties. Returns the geometries and the repair report of
+        `SpatialMethods.repair_geometries`.
+        """
+        geometries = SpatialMethods.geometries_from_geojson(
+            [feature.get("geometry") for feature in features],
+            ids=[(feature.get("properties") or {}).get(id_field) for feature in features],
+            label=label,
+        )
+        return SpatialMethods.repair_geometries(geometries)
+
+    @staticmethod
+    def _canonical_ids(ids: pd.Series) -> pd.Series:
+        """
+        Object ids as strings independent of the column dtype: 5, 5.0 and "5" all become
+        "5" and missing ids become "". Pandas hashes the same value differently per dtype.
+        """
+        numeric = pd.to_numeric(ids, errors="coerce")
+        integral = numeric.notna() & (numeric % 1 == 0)
+        canonical = ids.astype(str).astype(object)
+        canonical[integral] = numeric[integral].astype("int64").astype(str)
+        canonical[ids.isna()] = ""
+        return canonical
+
+    @staticmethod
+    def impute_storeys(gdf: gpd.GeoDataFrame, strategy: str) -> gpd.GeoDataFrame:
+        """
+        Fills in storeys of buildings flagged in the `storeys_imputed` column, in place.
+
+        Imputation is deterministic, so repeated runs over the same data give identical
+        results:
+          - "object_id": 2 to 5 storeys derived from a hash of `physical_object_id`,
+            independent of the id column's dtype;
+          - "median": the median storeys of buildings with floor data in the same frame,
+            or `DEFAULT_STOREYS` if there are none.
+
+        Returns:
+            gpd.GeoDataFrame: the same frame.
+        """
+        missing = gdf["storeys_imputed"].fillna(False).astype(bool).to_numpy()
+        if not missing.any():
+            return gdf
+        if strategy == "object_id":
+            hashes = pd.util.hash_pandas_object(
+                PreProcessingService._canonical_ids(gdf.loc[missing, "physical_object_id"]),
+                index=False,
+            ).to_numpy()
+            values = (2 + hashes % 4).astype(int)
+        else:
+            known = pd.to_numeric(gdf.loc[~missing, "storeys_count"], errors="coerce").dropna()
+            values = (
+                int(round(known.median()))
+                if not known.empty
+                else PreProcessingService.DEFAULT_STOREYS
+            )
+        gdf.loc[missing, "storeys_count"] = values
+        return gdf
+
+    @staticmethod
+    def flatten_fields(
+        records: list[dict], spec: dict[str, NestedField]
+    ) -> dict[str, pd.api.extensions.ExtensionArray | np.ndarray]:
+        """
+        Extracts nested values of all fields in `spec` from property dicts in one pass.
+
+        Each field follows its key path through nested dicts; missing values and values
+        under a non-dict parent become the field default. Fields with a dtype are returned
+        as pandas arrays of that dtype, the rest as numpy object arrays.
+
+        Args:
+            records: feature properties.
+            spec: output column name to the `NestedField` it is taken from.
+
+        Returns:
+            dict: column name to an array aligned with `records`.
+        """
+        fields = list(spec.items())
+        columns: dict[str, list] = {name: [] for name, _ in fields}
+        for record in records:
+            for name, field in fields:
+                value = record
+                for key in field.path:
+                    value = value.get(key) if isinstance(value, dict) else None
+                columns[name].append(field.default if value is None else value)
+        return {
+            name: (
+                pd.array(columns[name], dtype=field.dtype)
+                if field.dtype
+                else np.array(columns[name], dtype=object)
+            )
+            for name, field in fields
+        }
+
+    async def _ingest_geometries(
+        self, features: list[dict], id_field: str, label: str
+    ) -> np.ndarray:
+        """Runs `_parse_geometries` in a worker thread and records its repair report."""
+        geometries, report = await asyncio.to_thread(
+            self._parse_geometries, features, id_field, label
+        )
+        self._record_repairs(label, report)
+        return geometries
 
     async def extract_physical_objects(
-            self, scenario_id: int, is_context: bool
+            self, scenario_id: int, is_context: bool, use_cache: bool = True
     ) -> dict[str, gpd.GeoDataFrame]:
         """
         Extracts and processes physical objects for a given scenario from GeoJson,
         handling geometries and object attributes.
 
+        The objects are projected to a local UTM CRS once and carry their areas (m²) in the
+        `object_area` column, so downstream stages reuse both instead of reprojecting. The
+        processed objects are cached per scenario, context flag and scenario data version,
+        so all endpoints working with a scenario share one parse.
+
         Parameters:
         scenario_id : int
             The ID of the scenario for which physical objects are to be extracted.
         is_context : bool
             Flag indicating whether to fetch context-based data.
+        use_cache : bool
+            If False, the objects are parsed again instead of read from the cache.
 
         Returns:
         dict[str, gpd.GeoDataFrame]
-            Dictionary with processed GeoDataFrame with areas of water, green (grass) and forest objects.
+            Dictionary with processed GeoDataFrame and the total areas of every class in
+            `area_classes` (water, green (grass) and forest objects by default).
+        """
+        if self.caching is None or not use_cache:
+            gdf = await self._load_physical_objects(scenario_id, is_context)
+            areas = self.physical_object_areas(gdf, self.area_classes)
+            return {"physical_objects": gdf, **areas}
+
+        cache_fields = {
+            "scenario_id": scenario_id,
+            "is_context": is_context,
+            "storeys_imputation": self.storeys_imputation,
+            "data_version": await self.caching.data_version_async(f"scenario-{scenario_id}"),
+        }
+        gdf = await self.caching.get_or_compute_artifact(
+            SCENARIO_PHYSICAL_OBJECTS,
+            lambda: self._load_physical_objects(scenario_id, is_context),
+            lambda data: self.project_with_areas(SpatialMethods.gdf_from_geojson(data)),
+            **cache_fields,
+        )
+        areas = self.physical_object_areas(gdf, self.area_classes)
+        return {"physical_objects": gdf.copy(), **areas}
+
+    async def _load_physical_objects(
+        self, scenario_id: int, is_context: bool
+    ) -> gpd.GeoDataFrame:
+        """
+        Downloads and parses physical objects of a scenario into a GeoDataFrame of valid
+        polygonal objects in a local UTM CRS with their areas. See `extract_physical_objects`
+        for the parameters.
         """
         logger.info("Loading physical objects")
-        resp = await self.urban_db_api.get_all_physical_objects_geometries(
-            scenario_id, is_context
+        features = [
+            feature
+            async for feature in self.urban_db_api.iter_all_physical_objects_geometries(
+                scenario_id, is_context
+            )
+        ]
+        geometries = await self._ingest_geometries(
+            features, "object_geometry_id", "physical object"
         )
+        keep = shapely.is_valid(geometries) & ~shapely.is_empty(geometries)
 
         all_data: list[dict] = []
-
-        for feature in resp.get("features", []):
-            geom_json = feature.get("geometry")
-            props = feature.get("properties", {})
-
-            try:
-                geom = shape(geom_json)
-                if not geom.is_valid:
-                    geom = geom.buffer(0)
-                if not geom.is_valid or geom.is_empty:
-                    continue
-            except Exception as e:
-                logger.error(f"Error processing geometry: {e}")
+        for feature, geom, is_kept in zip(features, geometries, keep):
+            if not is_kept:
                 continue
+            props = feature.get("properties", {})
 
             for phys in props.get("physical_objects", []):
                 base = {
@@ -64,6 +257,7 @@ class PreProcessingService:
                     "geometry": geom,
                     "category": None,
                     "storeys_count": None,
+                    "storeys_imputed": False,
                     "living_area": None,
                     "service_id": None,
                     "service_name": None,
@@ -85,12 +279,13 @@ class PreProcessingService:
                     elif levels:
                         final_floors = int(levels)
                     else:
-                        final_floors = random.randint(2, 5)
+                        final_floors = None
 
                     base.update(
                         {
                             "category": "residential",
                             "storeys_count": final_floors,
+                            "storeys_imputed": final_floors is None,
                             "living_area": b_props.get("living_area_official")
                                            or b_props.get("living_area_modeled"),
                             "address": b_props.get("address", props.get("address")),
@@ -134,22 +329,36 @@ class PreProcessingService:
             raise http_exception(404,
                 "Physical objects GeoDataFrame is empty after filtering polygons."
             )
+        gdf = self.impute_storeys(gdf, self.storeys_imputation)
+        return await asyncio.to_thread(self.project_with_areas, gdf)
+
+    @staticmethod
+    def project_with_areas(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """
+        Projects physical objects to their local UTM CRS and stores the geometry areas (m²)
+        in the `object_area` column. This is the only reprojection of physical objects;
+        downstream stages work in the returned CRS.
+        """
         try:
             local_crs = gdf.estimate_utm_crs()
         except ValueError as e:
             raise http_exception(500, f"Failed to estimate UTM CRS: {e}")
+        projected = gdf.to_crs(local_crs)
+        projected["object_area"] = projected.geometry.area
+        return projected
 
-        water = (
-            gdf[gdf["object_type_id"].isin([45, 2, 44])].to_crs(local_crs).area.sum()
-        )
-        green = gdf[gdf["object_type_id"].isin([47, 3])].to_crs(local_crs).area.sum()
-        forests = gdf[gdf["object_type_id"].isin([48])].to_crs(local_crs).area.sum()
-
+    @staticmethod
+    def physical_object_areas(
+        gdf: gpd.GeoDataFrame, area_classes: dict[str, tuple[int, ...]]
+    ) -> dict[str, float]:
+        """
+        Sums the `object_area` of objects per class of `area_classes` (class name to
+        physical object type ids) with one aggregation by object type.
+        """
+        by_type = gdf.groupby("object_type_id")["object_area"].sum()
         return {
-            "physical_objects": gdf,
-            "water_objects": water,
-            "green_objects": green,
-            "forests": forests,
+            name: float(by_type.reindex(list(type_ids)).sum())
+            for name, type_ids in area_classes.items()
         }
 
     async def extract_landuse(
@@ -174,43 +383,24 @@ class PreProcessingService:
         ValueError
             If the input data is malformed or invalid.
         """
-        geojson_data = await self.urban_db_api.get_functional_zones_scenario_id(
-            scenario_id, is_context, source, year
-        )
         logger.info("Functional zones loading")
 
-        features = geojson_data["features"]
-        geometries = []
-        for feature in features:
-            try:
-                geom = shape(feature["geometry"])
-                if not geom.is_valid:
-                    geom = geom.buffer(0)
-                geometries.append(geom)
-            except Exception as e:
-                logger.error(f"Error processing geometry: {e}")
-                geometries.append(None)
-
+        features = [
+            feature
+            async for feature in self.urban_db_api.iter_functional_zones_scenario_id(
+                scenario_id, is_context, source, year
+            )
+        ]
+        geometries = await self._ingest_geometries(
+            features, "functional_zone_id", "functional zone"
+        )
         properties = [feature["properties"] for feature in features]
+
         landuse_polygons = gpd.GeoDataFrame(
             properties, geometry=geometries, crs="EPSG:4326"
         )
-
-        if "properties" in landuse_polygons.columns:
-            landuse_polygons["landuse_zone"] = landuse_polygons["properties"].apply(
-                lambda x: x.get("landuse_zon") if isinstance(x, dict) else None
-            )
-
-        if "functional_zone_type" in landuse_polygons.columns:
-            landuse_polygons["zone_type_id"] = landuse_polygons[
-                "functional_zone_type"
-            ].apply(lambda x: x.get("id") if isinstance(x, dict) else None)
-            landuse_polygons["zone_type_name"] = landuse_polygons[
-                "functional_zone_type"
-            ].apply(lambda x: x.get("name") if isinstance(x, dict) else None)
-            landuse_polygons["zone_type_nickname"] = landuse_polygons[
-                "functional_zone_type"
-            ].apply(lambda x: x.get("nickname") if isinstance(x, dict) else None)
+        for column, values in self.flatten_fields(properties, FUNCTIONAL_ZONE_FIELDS).items():
+            landuse_polygons[column] = values
 
         landuse_polygons["landuse_zone"] = (
             landuse_polygons["zone_type_id"].map(ZONE_CLASS_BY_ID).fillna("Unknown")
@@ -232,7 +422,9 @@ class PreProcessingService:
         return landuse_polygons
 
     @staticmethod
-    def parse_physical_object(obj: dict[str, any]) -> list[dict[str, any]]:
+    def parse_physical_object(
+        obj: dict[str, any], geometry: shapely.Geometry | None = None
+    ) -> list[dict[str, any]]:
         """
         Parses a single physical object from the API response into a structured dictionary
         with geometry and additional attributes.
@@ -240,7 +432,9 @@ class PreProcessingService:
         This function:
           - Parses the geometry and validates it.
           - Determines the object's category (residential, non_residential, recreational, or other).
-          - Calculates the number of storeys if building information is present.
+          - Calculates the number of storeys if building information is present; buildings
+            without floor data are flagged in `storeys_imputed` and filled in later by
+            `impute_storeys`.
           - Processes services if the object is non-residential.
 
         Returns a list of dictionaries because one object may contain multiple services,
@@ -248,22 +442,23 @@ class PreProcessingService:
 
         Parameters:
             obj (dict): A dictionary representing a physical object from the API response.
+            geometry (shapely.Geometry, optional): The object's geometry already parsed in
+                bulk by `_parse_physical_objects_page`; parsed from `obj` if omitted.
 
         Returns:
             list[dict]: A list of parsed physical objects with geometry and attributes ready for GeoDataFrame.
         """
-        geometry_json = obj.get("geometry")
-        if not geometry_json:
-            return []
-
-        try:
-            shp = shape(geometry_json)
-            if not shp.is_valid:
-                shp = shp.buffer(0)
-            if shp.is_empty:
+        shp = geometry
+        if shp is None:
+            if not obj.get("geometry"):
                 return []
-        except Exception as e:
-            logger.error(f"Error creating geometry: {e}")
+            geometries, _ = SpatialMethods.repair_geometries(
+                SpatialMethods.geometries_from_geojson(
+                    [obj["geometry"]], ids=[obj.get("physical_object_id")], label="physical object"
+                )
+            )
+            shp = geometries[0]
+        if shp is None or shp.is_empty:
             return []
 
         object_data = {
@@ -277,6 +472,7 @@ class PreProcessingService:
             "geometry": shp,
             "category": None,
             "storeys_count": None,
+            "storeys_imputed": False,
             "living_area": None,
             "service_id": None,
             "service_name": None,
@@ -300,14 +496,15 @@ class PreProcessingService:
                     num = int(building_levels)
                     final_floors = max(num, 1)
                 except ValueError:
-                    final_floors = random.randint(2, 5)
+                    final_floors = None
             else:
-                final_floors = random.randint(2, 5)
+                final_floors = None
 
             object_data.update(
                 {
                     "category": "residential",
                     "storeys_count": final_floors,
+                    "storeys_imputed": final_floors is None,
                     "living_area": (
                         building_props.get("living_area_official")
                         or building_props.get("living_area_modeled")
@@ -339,6 +536,74 @@ class PreProcessingService:
         return [object_data]
 
 
+    @staticmethod
+    def _parse_physical_objects_page(
+        objects: list[dict],
+    ) -> tuple[gpd.GeoDataFrame | None, dict[str, int]]:
+        """
+        Parses one page of physical objects into a GeoDataFrame chunk and returns it with
+        the geometry repair report of the page.
+        """
+        geometries, report = SpatialMethods.repair_geometries(
+            SpatialMethods.geometries_from_geojson(
+                [obj.get("geometry") for obj in objects],
+                ids=[obj.get("physical_object_id") for obj in objects],
+                label="physical object",
+            )
+        )
+        rows = []
+        for obj, geometry in zip(objects, geometries):
+            if geometry is not None:
+                rows.extend(PreProcessingService.parse_physical_object(obj, geometry))
+        if not rows:
+            return None, report
+        chunk = gpd.GeoDataFrame(pd.DataFrame(rows), geometry="geometry", crs="EPSG:4326")
+        return chunk, report
+
+
+    async def _parse_territory_pages_pipelined(
+        self, territory_id: int
+    ) -> list[gpd.GeoDataFrame]:
+        """
+        Downloads territory pages and parses them concurrently.
+
+        A producer task puts every downloaded page onto a bounded queue, and the consumer
+        parses each page into a GeoDataFrame chunk in a worker thread while the next pages
+        are still downloading. When the queue is full the producer stops pulling pages, which
+        in turn stops new downloads. Pages arrive in completion order, the chunks are
+        returned in page order, so the result does not depend on download timing.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.pipeline_queue_size)
+
+        async def produce() -> None:
+            try:
+                async for page in self.urban_db_api.iter_physical_objects_from_territory_pages(
+                    territory_id
+                ):
+                    await queue.put(page)
+            except Exception as e:
+                await queue.put(e)
+                return
+            await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        chunks: dict[int, gpd.GeoDataFrame] = {}
+        try:
+            while (page := await queue.get()) is not None:
+                if isinstance(page, Exception):
+                    raise page
+                page_number, objects = page
+                chunk, report = await asyncio.to_thread(
+                    self._parse_physical_objects_page, objects
+                )
+                self._record_repairs("territory physical object", report)
+                if chunk is not None:
+                    chunks[page_number] = chunk
+        finally:
+            producer.cancel()
+        return [chunks[page_number] for page_number in sorted(chunks)]
+
+
     async def extract_physical_objects_from_territory(
         self,
         territory_id: int,
@@ -348,33 +613,28 @@ class PreProcessingService:
 
         This function:
           - Fetches physical objects with geometry for the specified territory via parallel paginated requests.
-          - Parses each object, extracting relevant attributes and geometry.
-          - Builds a GeoDataFrame from the parsed objects.
-          - Separates water bodies, green areas, and forests for area calculations.
+          - Parses each page into a GeoDataFrame chunk as soon as it arrives, overlapping downloads and parsing.
+          - Concatenates the chunks into one GeoDataFrame.
+          - Projects the objects to a local UTM CRS once and computes their areas.
+          - Sums the areas by object class (see `area_classes`).
 
         Returns:
             dict[str, gpd.GeoDataFrame]: A dictionary containing:
-                - "physical_objects": GeoDataFrame of all valid physical objects
-                - "water_objects": total area of water objects (in square meters)
-                - "green_objects": total area of green objects (in square meters)
-                - "forests": total area of forest objects (in square meters)
+                - "physical_objects": GeoDataFrame of all valid physical objects in a local
+                  UTM CRS, with their areas in the "object_area" column
+                - one total area (in square meters) per class of `area_classes`, by default
+                  "water_objects", "green_objects" and "forests"
         """
         logger.info("Physical objects are loading with parallel processing")
-        raw_objects = await self.urban_db_api.get_physical_objects_from_territory_parallel(territory_id)
-        all_data = []
-
-        for obj in raw_objects:
-            parsed_objects = PreProcessingService.parse_physical_object(obj)
-            all_data.extend(parsed_objects)
-        if not all_data:
+        chunks = await self._parse_territory_pages_pipelined(territory_id)
+        if not chunks:
             raise http_exception(
                 404, "No physical objects found for territory ID", territory_id
             )
 
         logger.success("Physical objects are loaded, creating the  GeoDataFrame")
-        all_data_df = pd.DataFrame(all_data)
         all_data_gdf = gpd.GeoDataFrame(
-            all_data_df, geometry="geometry", crs="EPSG:4326"
+            pd.concat(chunks, ignore_index=True), geometry="geometry", crs="EPSG:4326"
         )
         all_data_gdf = all_data_gdf.drop_duplicates(subset="physical_object_id")
         all_data_gdf = all_data_gdf.dropna(subset=["geometry"])
@@ -388,26 +648,13 @@ class PreProcessingService:
                 "No polygonal physical objects found for territory ID",
                 territory_id,
             )
-        local_crs = all_data_gdf.estimate_utm_crs()
-
-        water_objects_gdf = all_data_gdf[
-            all_data_gdf["object_type_id"].isin([45, 2, 44])
-        ].to_crs(local_crs)
-
-        green_objects_gdf = all_data_gdf[
-            all_data_gdf["object_type_id"].isin([47, 3])
-        ].to_crs(local_crs)
-
-        forests_gdf = all_data_gdf[all_data_gdf["object_type_id"].isin([48])].to_crs(
-            local_crs
-        )
+        all_data_gdf = self.impute_storeys(all_data_gdf.copy(), self.storeys_imputation)
+        all_data_gdf = await asyncio.to_thread(self.project_with_areas, all_data_gdf)
 
         logger.success("Physical objects are successfully loaded into GeoDataFrame")
         return {
             "physical_objects": all_data_gdf,
-            "water_objects": water_objects_gdf.area.sum(),
-            "green_objects": green_objects_gdf.area.sum(),
-            "forests": forests_gdf.area.sum(),
+            **self.physical_object_areas(all_data_gdf, self.area_classes),
         }
 
 
@@ -439,57 +686,22 @@ class PreProcessingService:
         logger.info("Functional zones are loading")
 
         features = geojson_data
-        geometries = []
-        for feature in features:
-            try:
-                geom = shape(feature["geometry"])
-                if not geom.is_valid:
-                    geom = geom.buffer(0)
-                geometries.append(geom)
-            except Exception as e:
-                logger.error(f"Error processing geometry: {e}")
-                geometries.append(None)
+        geometries = await self._ingest_geometries(
+            features, "functional_zone_id", "functional zone"
+        )
 
         properties = [feature["properties"] for feature in features]
         landuse_polygons = gpd.GeoDataFrame(
             properties, geometry=geometries, crs="EPSG:4326"
         )
-
+        spec = dict(TERRITORY_FUNCTIONAL_ZONE_FIELDS)
         if "properties" in landuse_polygons.columns:
-            landuse_polygons["landuse_zone"] = landuse_polygons["properties"].apply(
-                lambda x: x.get("landuse_zon") if isinstance(x, dict) else None
-            )
-
-        if "functional_zone_type" in landuse_polygons.columns:
-            landuse_polygons["zone_type_id"] = landuse_polygons[
-                "functional_zone_type"
-            ].apply(lambda x: x.get("id") if isinstance(x, dict) else None)
-            landuse_polygons["zone_type_name"] = landuse_polygons[
-                "functional_zone_type"
-            ].apply(
-                lambda x: (
-                    x.get("name")
-                    if isinstance(x, dict) and x.get("name") != "unknown"
-                    else "residential"
-                )
-            )
-            landuse_polygons["zone_type_nickname"] = landuse_polygons[
-                "functional_zone_type"
-            ].apply(
-                lambda x: (
-                    x.get("nickname")
-                    if isinstance(x, dict) and x.get("nickname") != "unknown"
-                    else "Жилая зона"
-                )
-            )
-
-        if "territory" in landuse_polygons.columns:
-            landuse_polygons["zone_type_parent_territory_id"] = landuse_polygons[
-                "territory"
-            ].apply(lambda x: x.get("id") if isinstance(x, dict) else None)
-            landuse_polygons["zone_type_parent_territory_name"] = landuse_polygons[
-                "territory"
-            ].apply(lambda x: x.get("name") if isinstance(x, dict) else None)
+            spec.update(LANDUSE_ZONE_FIELD)
+        for column, values in self.flatten_fields(properties, spec).items():
+            landuse_polygons[column] = values
+        # zones without a zone type are residential; a type without a nickname stays None
+        untyped = [not isinstance(p.get("functional_zone_type"), dict) for p in properties]
+        landuse_polygons.loc[untyped, "zone_type_nickname"] = "Жилая зона"
 
         landuse_polygons.drop(
             columns=[
@@ -565,38 +777,20 @@ class PreProcessingService:
             )
             return gdf
 
-        records = []
-        for feat in all_features:
-            geom_json = feat.get("geometry")
-            try:
-                geom = shape(geom_json) if geom_json else None
-            except Exception:
-                geom = None
-
-            props = feat.get("properties", {})
-            svc_type = props.pop("service_type", {})
-            uf = svc_type.pop("urban_function", {})
-
-            territories = props.pop("territories", [])
-            terr = territories[0] if territories else {}
-
-            flat = {
-                "service_name": props.get("name"),
-                "capacity": props.get("capacity"),
-                "service_type_id": svc_type.get("service_type_id"),
-                "service_type_name": svc_type.get("name"),
-                **{
-                    k: v
-                    for k, v in props.get("properties", {}).items()
-                    if k not in ("name", "is_capacity_real")
-                },
-                "geometry": geom,
-            }
-
-            records.append(flat)
-
-        df = pd.DataFrame(records)
-        gdf = gpd.GeoDataFrame(df, geometry="geometry", crs="EPSG:4326")
+        geometries = await self._ingest_geometries(all_features, "service_id", "service")
+        props = [feat.get("properties") or {} for feat in all_features]
+        df = pd.DataFrame(self.flatten_fields(props, SERVICE_FIELDS))
+        # free-form attributes of a service, they take precedence over the fields above
+        # in the rows that have them
+        extra_props = [p.get("properties") or {} for p in props]
+        extra = pd.DataFrame.from_records(extra_props, index=df.index).drop(
+            columns=["name", "is_capacity_real"], errors="ignore"
+        )
+        for column in extra.columns.intersection(df.columns):
+            present = np.array([column in p for p in extra_props])
+            df[column] = extra[column].where(present, df[column].astype(object))
+        df = pd.concat([df, extra.drop(columns=df.columns, errors="ignore")], axis=1)
+        gdf = gpd.GeoDataFrame(df, geometry=geometries, crs="EPSG:4326")
         gdf = gdf.to_crs(gdf.estimate_utm_crs())
         gdf = gdf[gdf.geometry.type.isin(["Polygon", "MultiPolygon"])]
         gdf = gdf.drop(
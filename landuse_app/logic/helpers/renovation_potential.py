@@ -1,5 +1,4 @@
 import asyncio
-import json
 from typing import Optional
 
 import geopandas as gpd
@@ -11,12 +10,15 @@ from shapely import MultiPolygon, Polygon
 
 from landuse_app.schemas import GeoJSON, Profile
 from storage.caching import CachingService
+from storage.fingerprint import fingerprint
 from .interpretation_service import InterpretationService
 from .preprocessing_service import PreProcessingService
 from .urban_api_access import UrbanAPIAccess
 # from storage.caching import CachingService
 
 from ...exceptions.http_exception_wrapper import http_exception
+from ..api.urban_db_api_client import fresh_responses
+from ..constants.cache_keys import RENOVATION_POTENTIAL_BY_INPUT, SCENARIO_RENOVATION_POTENTIAL
 from ..constants.constants import actual_zone_mapping
 from .spatial_methods import SpatialMethods
 
@@ -29,12 +31,15 @@ class RenovationPotential:
         caching: CachingService,
         interpretation: InterpretationService,
         urban_api_access:UrbanAPIAccess,
-        preprocessing: PreProcessingService
+        preprocessing: PreProcessingService,
+        content_addressed: bool = False,
     ):
         self.caching = caching
         self.interpretation = interpretation
         self.preprocessing = preprocessing
         self.urban_api_access = urban_api_access
+        # Key the analysis by a fingerprint of its inputs instead of the scenario id
+        self.content_addressed = content_addressed
 
     def calculate_building_percentages(self, buildings_gdf: gpd.GeoDataFrame) -> pd.Series:
         """
@@ -382,7 +387,10 @@ class RenovationPotential:
         """
 
         def _sync_bulk(zones_gdf, phys_gdf, mapping):
-            utm_crs = zones_gdf.estimate_utm_crs()
+            # projected inputs (see PreProcessingService.project_with_areas) are used as is
+            utm_crs = (
+                zones_gdf.crs if zones_gdf.crs.is_projected else zones_gdf.estimate_utm_crs()
+            )
             phys = phys_gdf.to_crs(utm_crs).copy()
             zones = zones_gdf.to_crs(utm_crs).copy().reset_index(drop=True)
 
@@ -400,7 +408,12 @@ class RenovationPotential:
             if drop_existing:
                 zones = zones.drop(columns=drop_existing)
 
-            phys["object_area"] = phys.geometry.area
+            if "object_area" in phys.columns and phys_gdf.crs.is_exact_same(utm_crs):
+                missing = phys["object_area"].isna()
+                if missing.any():
+                    phys.loc[missing, "object_area"] = phys.geometry[missing].area
+            else:
+                phys["object_area"] = phys.geometry.area
 
             mask_res = pd.Series(False, index=phys.index)
             if "object_type_id" in phys.columns:
@@ -512,22 +525,90 @@ class RenovationPotential:
             source_key = source
             year_key = year
 
-        cache_name = f"renovation_potential_project-{scenario_id}_is_context-{is_context}"
-        cache_file = self.caching.get_recent_cache_file(
-            cache_name, {"profile": profile_key, "source": source_key, "year": year_key}
+        if self.content_addressed:
+            landuse_polygons_ren_pot = await self._calculate_renovation_potential(
+                scenario_id, is_context, profile, source, year
+            )
+            return landuse_polygons_ren_pot.copy()
+
+        cache_fields = {
+            "scenario_id": scenario_id,
+            "is_context": is_context,
+            "profile": profile_key,
+            "source": source_key,
+            "year": year_key,
+            "data_version": await self.caching.data_version_async(f"scenario-{scenario_id}"),
+        }
+        landuse_polygons_ren_pot = await self.caching.get_or_compute_artifact(
+            SCENARIO_RENOVATION_POTENTIAL,
+            lambda: self._calculate_renovation_potential(
+                scenario_id, is_context, profile, source, year
+            ),
+            SpatialMethods.gdf_from_geojson,
+            **cache_fields,
         )
+        return landuse_polygons_ren_pot.copy()
 
-        if cache_file and self.caching.is_cache_valid(cache_file):
-            logger.info(f"Using cached renovation potential for scenario {scenario_id}")
-            cached_data = self.caching.load_cache(cache_file)
-            return gpd.GeoDataFrame.from_features(cached_data, crs="EPSG:4326")
+    async def _calculate_renovation_potential(
+        self,
+        scenario_id: int,
+        is_context: bool,
+        profile: Optional[Profile] = None,
+        source: str = None,
+        year: str = None,
+    ) -> gpd.GeoDataFrame:
+        """
+        Fetches the inputs and runs the renovation potential analysis for a scenario,
+        bypassing the scenario cache. In content-addressed mode the analysis result is
+        cached by a fingerprint of the fetched zones, objects and profile instead, so it
+        is shared by scenarios with identical inputs and invalidated by any edit. The
+        fingerprinted inputs are then fetched from Urban API, not from the response and
+        physical objects caches, so an edit shows up in the fingerprint at once.
+        See `get_renovation_potential` for the parameters.
+        """
+        with fresh_responses(self.content_addressed):
+            physical_objects_dict, landuse_polygons = await asyncio.gather(
+                self.preprocessing.extract_physical_objects(
+                    scenario_id, is_context, use_cache=not self.content_addressed
+                ),
+                self.preprocessing.extract_landuse(scenario_id, is_context, source, year),
+            )
+        physical_objects = physical_objects_dict["physical_objects"]
+        if not self.content_addressed:
+            return await self._analyze_renovation_potential(
+                landuse_polygons, physical_objects, profile
+            )
 
-        physical_objects_dict, landuse_polygons = await asyncio.gather(
-            self.preprocessing.extract_physical_objects(scenario_id, is_context),
-            self.preprocessing.extract_landuse(scenario_id, is_context, source, year),
+        profile_key = str(profile) if profile is not None else "no_profile"
+        input_fingerprint = await asyncio.to_thread(
+            fingerprint, landuse_polygons, physical_objects, profile_key
+        )
+        landuse_polygons_ren_pot = await self.caching.get_or_compute_artifact(
+            RENOVATION_POTENTIAL_BY_INPUT,
+            lambda: self._analyze_renovation_potential(
+                landuse_polygons, physical_objects, profile
+            ),
+            fingerprint=input_fingerprint,
+        )
+        logger.info(
+            f"Renovation potential for scenario {scenario_id} keyed by inputs {input_fingerprint}"
+        )
+        return landuse_polygons_ren_pot.copy()
+
+    async def _analyze_renovation_potential(
+        self,
+        landuse_polygons: gpd.GeoDataFrame,
+        physical_objects: gpd.GeoDataFrame,
+        profile: Optional[Profile] = None,
+    ) -> gpd.GeoDataFrame:
+        """
+        Renovation potential analysis of fetched functional zones and physical objects.
+        """
+        utm_crs = (
+            physical_objects.crs
+            if physical_objects.crs.is_projected
+            else physical_objects.estimate_utm_crs()
         )
-        physical_objects = physical_objects_dict["physical_objects"]
-        utm_crs = physical_objects.estimate_utm_crs()
         physical_objects = physical_objects.to_crs(utm_crs)
         landuse_polygons = landuse_polygons.to_crs(utm_crs)
 
@@ -581,16 +662,7 @@ class RenovationPotential:
                 "No intersections between buffers and polygons were found,"
                 " returning polygons without intersections"
             )
-            landuse_polygons_ren_pot = zones.to_crs(epsg=4326)
-
-            result_json = json.loads(landuse_polygons_ren_pot.to_json())
-            self.caching.save_with_cleanup(
-                result_json,
-                cache_name,
-                {"profile": profile_key, "source": source_key, "year": year_key},
-            )
-
-            return landuse_polygons_ren_pot
+            return zones.to_crs(epsg=4326)
         else:
             try:
                 joined["intersection_area"] = joined.apply(
@@ -620,16 +692,7 @@ class RenovationPotential:
             "Не подлежащие реновации"
         )
         zones.loc[to_update, "Converted"] = True
-        landuse_polygons_ren_pot = zones.to_crs(epsg=4326)
-
-        result_json = json.loads(landuse_polygons_ren_pot.to_json())
-        self.caching.save_with_cleanup(
-            result_json,
-            cache_name,
-            {"profile": profile_key, "source": source_key, "year": year_key},
-        )
-
-        return landuse_polygons_ren_pot
+        return zones.to_crs(epsg=4326)
 
 
     async def filter_response(
@@ -0,0 +1,81 @@
+import asyncio
+
+from loguru import logger
+
+from storage.caching import CachingService
+from .renovation_potential import RenovationPotential
+
+
+class ScenarioCacheService:
+    """
+    Keeps cached scenario artifacts in sync with scenario events.
+
+    A refresh bumps the scenario's data version, which invalidates every artifact derived
+    from its data, drops the cached Urban API responses of the scenario and, if enabled,
+    recomputes the main scenario results in the background.
+    """
+
+    def __init__(
+        self,
+        caching: CachingService,
+        renovation: RenovationPotential,
+        warm_up: bool = False,
+    ):
+        self.caching = caching
+        self.renovation = renovation
+        self.warm_up_enabled = warm_up
+        self._warm_ups: dict[int, asyncio.Task] = {}
+
+    def invalidate(self, scenario_id: int) -> int:
+        """
+        Invalidates all cached data of a scenario. Blocking; run it in a worker thread.
+
+        Returns:
+            int: number of removed Urban API response entries.
+        """
+        version = self.caching.bump_data_version(f"scenario-{scenario_id}")
+        removed = self.caching.invalidate_prefix(f"api_v1_scenarios_{scenario_id}_")
+        logger.info(
+            f"Cache of scenario {scenario_id} invalidated: data version {version}, "
+            f"{removed} Urban API responses removed"
+        )
+        return removed
+
+    async def refresh(self, scenario_id: int) -> None:
+        """Invalidates the scenario's cache and schedules a background warm-up if enabled."""
+        await asyncio.to_thread(self.invalidate, scenario_id)
+        if not self.warm_up_enabled:
+            return
+        previous = self._warm_ups.get(scenario_id)
+        if previous is not None:
+            previous.cancel()
+        task = asyncio.create_task(self.warm_up(scenario_id))
+        self._warm_ups[scenario_id] = task
+        task.add_done_callback(lambda t: self._forget_warm_up(scenario_id, t))
+
+    def _forget_warm_up(self, scenario_id: int, task: asyncio.Task) -> None:
+        if self._warm_ups.get(scenario_id) is task:
+            del self._warm_ups[scenario_id]
+
+    async def warm_up(self, scenario_id: int) -> None:
+        """
+        Pre-computes the renovation potential of the scenario (also used for the
+        urbanization level), so the first request hits a warm cache. This warms the
+        renovation potential and physical objects artifacts and the Urban API responses
+        of the scenario's functional zones and objects; land-use percentages are not
+        cached and are computed cheaply from those on request.
+        """
+        logger.info(f"Warming up cache for scenario {scenario_id}")
+        try:
+            await self.renovation.get_renovation_potential(scenario_id, is_context=False)
+        except Exception as e:
+            logger.warning(f"Cache warm-up for scenario {scenario_id} failed: {e}")
+            return
+        logger.info(f"Cache for scenario {scenario_id} is warm")
+
+    async def stop(self) -> None:
+        """Cancels running warm-ups."""
+        tasks = list(self._warm_ups.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -3,14 +3,124 @@ from typing import Union
 
 import geopandas as gpd
 import numpy as np
+import shapely
+from loguru import logger
 from pyproj import CRS
 from pyproj.aoi import AreaOfInterest
 from pyproj.database import query_utm_crs_info
+from shapely.geometry import shape
 from shapely.geometry.base import BaseGeometry
 from shapely.wkt import dumps, loads
 
+from landuse_app.common import json_codec
+
+POLYGON_TYPE_ID = 3
+POLYGONAL_TYPE_IDS = (3, 6)  # Polygon, MultiPolygon
+
 
 class SpatialMethods:
+    @staticmethod
+    def gdf_from_geojson(data: dict) -> gpd.GeoDataFrame:
+        """
+        Restores a GeoJSON FeatureCollection dict (legacy or fallback JSON cache entries,
+        always in WGS 84) as a GeoDataFrame.
+        """
+        return gpd.GeoDataFrame.from_features(data, crs="EPSG:4326")
+
+    @staticmethod
+    def geometries_from_geojson(
+        geometries: list[dict | None], ids: list | None = None, label: str = "feature"
+    ) -> np.ndarray:
+        """
+        Parses GeoJSON geometry objects into a shapely geometry array with one vectorized
+        call instead of a `shape()` per feature.
+
+        Missing geometries become None. Geometries the bulk reader rejects are retried one
+        by one, and the ones that still fail become None and are logged with their id (or
+        position), so a bad feature is skipped without failing the batch.
+
+        Args:
+            geometries: GeoJSON geometry dicts, None for features without geometry.
+            ids: identifiers used in error messages, aligned with `geometries`.
+            label: name of the feature kind used in error messages.
+
+        Returns:
+            numpy object array of shapely geometries and None values.
+        """
+        encoded = np.array(
+            [json_codec.dumps(g).decode() if g else None for g in geometries], dtype=object
+        )
+        parsed = shapely.from_geojson(encoded, on_invalid="ignore")
+        failed = np.flatnonzero(shapely.is_missing(parsed) & (encoded != None))  # noqa: E711
+        for i in failed:
+            try:
+                parsed[i] = shape(geometries[i])
+            except Exception as e:
+                feature_id = ids[i] if ids is not None else i
+                logger.error(f"Error processing geometry of {label} {feature_id}: {e}")
+                parsed[i] = None
+        return parsed
+
+    @staticmethod
+    def _polygonal_parts(geometries: np.ndarray) -> np.ndarray:
+        """
+        Keeps only the polygons of each geometry, as a Polygon for a single part or a
+        MultiPolygon otherwise; geometries without polygonal parts become None.
+        """
+        parts, index = shapely.get_parts(geometries, return_index=True)
+        parts, sub_index = shapely.get_parts(parts, return_index=True)
+        index = index[sub_index]
+        is_polygon = shapely.get_type_id(parts) == POLYGON_TYPE_ID
+        result = np.full(len(geometries), None, dtype=object)
+        if is_polygon.any():
+            shapely.multipolygons(parts[is_polygon], indices=index[is_polygon], out=result)
+            single = shapely.get_num_geometries(result) == 1
+            result[single] = shapely.get_geometry(result[single], 0)
+        return result
+
+    @staticmethod
+    def repair_geometries(geometries: np.ndarray) -> tuple[np.ndarray, dict[str, int]]:
+        """
+        Repairs invalid geometries of an array with one vectorized `make_valid` call.
+
+        Unlike a zero-width buffer, `make_valid` keeps every part of a self-intersecting
+        multipolygon. Polygonal geometries stay polygonal: line and point debris produced
+        by the repair is removed, and geometries with nothing polygonal left are dropped
+        (set to None).
+
+        Args:
+            geometries: numpy object array of shapely geometries and None values.
+
+        Returns:
+            The repaired array and counters: "invalid" geometries found, "repaired",
+            "dropped" and "type_changed" (repaired into a different geometry type, e.g.
+            a Polygon split into a MultiPolygon).
+        """
+        invalid = ~shapely.is_valid(geometries) & ~shapely.is_missing(geometries)
+        report = {"invalid": int(invalid.sum()), "repaired": 0, "dropped": 0, "type_changed": 0}
+        if not report["invalid"]:
+            return geometries, report
+
+        source = geometries[invalid]
+        source_types = shapely.get_type_id(source)
+        repaired = shapely.make_valid(source)
+        polygonal = np.isin(source_types, POLYGONAL_TYPE_IDS)
+        if polygonal.any():
+            repaired[polygonal] = SpatialMethods._polygonal_parts(repaired[polygonal])
+
+        dropped = shapely.is_missing(repaired) | shapely.is_empty(repaired)
+        repaired[dropped] = None
+        type_changed = ~dropped & (shapely.get_type_id(repaired) != source_types)
+        report.update(
+            repaired=int((~dropped).sum()),
+            dropped=int(dropped.sum()),
+            type_changed=int(type_changed.sum()),
+        )
+
+        geometries = geometries.copy()
+        geometries[invalid] = repaired
+        return geometries, report
+
     @staticmethod
     async def round_coords_geom(
         geometry: gpd.GeoSeries | BaseGeometry, ndigits: int = 5
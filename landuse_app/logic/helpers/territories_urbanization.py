@@ -1,5 +1,4 @@
 import asyncio
-import json
 from datetime import datetime
 
 import geopandas as gpd
@@ -10,8 +9,10 @@ from pandarallel import pandarallel
 from storage.caching import CachingService
 from .preprocessing_service import PreProcessingService
 from .renovation_potential import RenovationPotential
+from .spatial_methods import SpatialMethods
 from .urban_api_access import UrbanAPIAccess
 from ..constants import actual_zone_mapping
+from ..constants.cache_keys import TERRITORY_RENOVATION_POTENTIAL
 
 pandarallel.initialize(progress_bar=False, nb_workers=4)
 
@@ -64,24 +65,34 @@ class TerritoriesUrbanization:
         else:
             source_key = source
 
-        cache_name = f"renovation_potential_territory-{territory_id}"
-        cache_file = self.caching_service.get_recent_cache_file(
-            cache_name, {"profile": "no_profile", "source": source_key}
+        cache_fields = {
+            "territory_id": territory_id,
+            "profile": "no_profile",
+            "source": source_key,
+        }
+        landuse_polygons = await self.caching_service.get_or_compute_artifact(
+            TERRITORY_RENOVATION_POTENTIAL,
+            lambda: self._calculate_territory_renovation_potential(territory_id, source),
+            SpatialMethods.gdf_from_geojson,
+            **cache_fields,
         )
+        return landuse_polygons.copy()
 
-        if cache_file and self.caching_service.is_cache_valid(cache_file):
-            logger.info(f"Using cached renovation potential for project {territory_id}")
-            cached_data = self.caching_service.load_cache(cache_file)
-            return gpd.GeoDataFrame.from_features(cached_data, crs="EPSG:4326")
-
+    async def _calculate_territory_renovation_potential(
+        self, territory_id: int, source: str = None
+    ) -> gpd.GeoDataFrame:
+        """
+        Runs the renovation potential and urbanization analysis for a territory, bypassing
+        the cache. See `get_territory_renovation_potential` for the parameters.
+        """
         physical_objects_dict, landuse_polygons = await asyncio.gather(
             self.preprocess.extract_physical_objects_from_territory(territory_id),
             self.preprocess.extract_landuse_from_territory(territory_id, source),
         )
         logger.success("Physical objects are loaded")
+        # physical objects come projected to their local UTM CRS
         physical_objects = physical_objects_dict["physical_objects"]
-        utm_crs = physical_objects.estimate_utm_crs()
-        physical_objects = physical_objects.to_crs(utm_crs)
+        utm_crs = physical_objects.crs
         landuse_polygons = landuse_polygons.to_crs(utm_crs)
 
         services_gdf = await self.preprocess.extract_services(territory_id)
@@ -139,13 +150,7 @@ class TerritoriesUrbanization:
                         "Высоко урбанизированная территория"
                     )
 
-        landuse_polygons = zones.to_crs("EPSG:4326")
-        result_json = json.loads(landuse_polygons.to_json())
-        self.caching_service.save_with_cleanup(
-            result_json, cache_name, {"profile": "no_profile", "source": source_key}
-        )
-
-        return landuse_polygons
+        return zones.to_crs("EPSG:4326")
 
 
     async def compute_urbanization_indicator(
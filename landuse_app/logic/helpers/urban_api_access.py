@@ -1,17 +1,26 @@
-import asyncio
-
 import pandas as pd
 from iduconfig import Config
 from loguru import logger
 
+from landuse_app.config import config_value
 from landuse_app.exceptions.http_exception_wrapper import http_exception
+from landuse_app.logic.api.paginator import AdaptivePaginator
 from landuse_app.logic.api.urban_db_api_client import RequestHandler
 
 
 class UrbanAPIAccess:
-    def __init__(self, requests_handler: RequestHandler, config: Config):
+    def __init__(
+        self,
+        requests_handler: RequestHandler,
+        config: Config,
+        paginator: AdaptivePaginator | None = None,
+    ):
         self.requests_handler = requests_handler
         self.config = config
+        self.paginator = paginator or AdaptivePaginator.from_config(requests_handler, config)
+        self.stream_responses = str(
+            config_value(config, "STREAM_LARGE_RESPONSES", "")
+        ).lower() in ("true", "1", "yes")
 
     async def get_projects_territory(self, project_id: int) -> dict:
         """
@@ -143,22 +152,14 @@ class UrbanAPIAccess:
         return source_data_df.sort_values("year", ascending=False).iloc[0].to_dict()
 
 
-    async def get_functional_zones_scenario_id(
+    async def _functional_zones_scenario_endpoint(
         self, scenario_id: int, is_context: bool = False, source: str = None, year: int = None
-    ) -> dict:
+    ) -> str:
         """
-        Fetches functional zones for a project with an optional context flag and source selection.
-
-        Parameters:
-        project_id (int): ID of the project.
-        is_context (bool): Flag to determine if context data should be fetched. Default is False.
-        source (str, optional): The preferred source (PZZ or OSM). If not provided, the best source is selected automatically.
-
-        Returns:
-        dict: Response data from the API.
+        Selects the functional zone source for a scenario and forms the functional zones endpoint.
 
         Raises:
-        http_exception: If the response is empty or the specified source is not available.
+        http_exception: If no valid source is available.
         """
         # base_scenario_id = await get_projects_base_scenario_id(scenario_id)
         source_data = await self.get_functional_zone_sources(
@@ -174,9 +175,30 @@ class UrbanAPIAccess:
         year = source_data["year"]
 
         if is_context:
-            endpoint = f"/api/v1/scenarios/{scenario_id}/context/functional_zones?year={year}&source={source}"
-        else:
-            endpoint = f"/api/v1/scenarios/{scenario_id}/functional_zones?year={year}&source={source}"
+            return f"/api/v1/scenarios/{scenario_id}/context/functional_zones?year={year}&source={source}"
+        return f"/api/v1/scenarios/{scenario_id}/functional_zones?year={year}&source={source}"
+
+
+    async def get_functional_zones_scenario_id(
+        self, scenario_id: int, is_context: bool = False, source: str = None, year: int = None
+    ) -> dict:
+        """
+        Fetches functional zones for a project with an optional context flag and source selection.
+
+        Parameters:
+        project_id (int): ID of the project.
+        is_context (bool): Flag to determine if context data should be fetched. Default is False.
+        source (str, optional): The preferred source (PZZ or OSM). If not provided, the best source is selected automatically.
+
+        Returns:
+        dict: Response data from the API.
+
+        Raises:
+        http_exception: If the response is empty or the specified source is not available.
+        """
+        endpoint = await self._functional_zones_scenario_endpoint(
+            scenario_id, is_context, source, year
+        )
 
         response = await self.requests_handler.get(endpoint)
         if not response or "features" not in response or not response["features"]:
@@ -187,6 +209,40 @@ class UrbanAPIAccess:
         return response
 
 
+    async def iter_functional_zones_scenario_id(
+        self, scenario_id: int, is_context: bool = False, source: str = None, year: int = None
+    ):
+        """
+        Yields functional zone features for a scenario one by one.
+
+        With STREAM_LARGE_RESPONSES enabled the features are decoded incrementally
+        from the response body, otherwise the regular (cached) GET is used.
+
+        Raises:
+        http_exception: If no features were returned.
+        """
+        if not self.stream_responses:
+            response = await self.get_functional_zones_scenario_id(
+                scenario_id, is_context, source, year
+            )
+            for feature in response["features"]:
+                yield feature
+            return
+
+        endpoint = await self._functional_zones_scenario_endpoint(
+            scenario_id, is_context, source, year
+        )
+        found = False
+        async for feature in self.requests_handler.stream_items(endpoint):
+            found = True
+            yield feature
+
+        if not found:
+            raise http_exception(
+                404, "No functional zones found for the given project ID", scenario_id
+            )
+
+
     async def get_all_physical_objects_geometries(
         self, scenario_id: int, is_context: bool = False
     ) -> dict:
@@ -221,6 +277,40 @@ class UrbanAPIAccess:
         return response
 
 
+    async def iter_all_physical_objects_geometries(
+        self, scenario_id: int, is_context: bool = False
+    ):
+        """
+        Yields physical object geometry features for a scenario one by one.
+
+        With STREAM_LARGE_RESPONSES enabled the features are decoded incrementally
+        from the response body, otherwise the regular (cached) GET is used.
+
+        Raises:
+            http_exception: If the request fails.
+        """
+        if not self.stream_responses:
+            response = await self.get_all_physical_objects_geometries(
+                scenario_id, is_context
+            )
+            for feature in (response or {}).get("features", []):
+                yield feature
+            return
+
+        endpoint = (
+            f"/api/v1/scenarios/{scenario_id}/context/geometries_with_all_objects"
+            if is_context
+            else f"/api/v1/scenarios/{scenario_id}/geometries_with_all_objects"
+        )
+        try:
+            async for feature in self.requests_handler.stream_items(endpoint):
+                yield feature
+        except Exception as e:
+            raise http_exception(
+                404, "No geometries found for the given scenario ID:", str(e)
+            )
+
+
     async def get_all_physical_objects_geometries_type_id(
         self, scenario_id: int, object_type_id: int
     ) -> dict:
@@ -396,10 +486,14 @@ class UrbanAPIAccess:
         return response
 
 
-    async def get_target_cities(self, territory_id: int) -> dict:
-        endpoint = f"/api/v1/all_territories_without_geometry?parent_id={territory_id}&page_size=5000&get_all_levels=true&cities_only=true"
-        response = await self.requests_handler.get(endpoint)
-        return response
+    async def get_target_cities(self, territory_id: int) -> list[dict]:
+        """
+        Fetches all cities of a territory on every nested level, paginated
+        by the adaptive paginator.
+        """
+        endpoint = "/api/v1/all_territories_without_geometry"
+        params = {"parent_id": territory_id, "get_all_levels": "true", "cities_only": "true"}
+        return await self.paginator.fetch_all(endpoint, params)
 
 
     async def get_physical_objects_from_territory(self, territory_id: int) -> dict:
@@ -518,53 +612,14 @@ class UrbanAPIAccess:
         endpoint = "/api/v1/indicator_value"
         return await self.requests_handler.put(endpoint, data=indicator_data)
 
-    async def get_physical_objects_from_territory_parallel(
-        self, territory_id: int
-    ) -> list[dict]:
-        """
-        Fetch physical objects from a territory in parallel with a concurrency limit of 5.
-
-        This asynchronous function retrieves all physical objects for a given territory using the
-        endpoint /territory/{territory_id}/physical_objects_with_geometry. It paginates through the results
-        based on the provided page_size and uses the get() method from self.urban_db_api
-        to make API requests. The function limits concurrent requests to 5.
 
-        Parameters:
-            territory_id (int): The unique identifier of the territory.
-            page_size (int, optional): The number of objects to request per page (default is 5000).
-
-        Returns:
-            list[dict]: A list of dictionaries, where each dictionary represents a physical object.
-        """
-        page_size = int(self.config.get("PAGE_SIZE"))
-        endpoint = f"/api/v1/territory/{territory_id}/physical_objects_with_geometry?page=1&page_size={page_size}"
-        initial_response = await self.requests_handler.get(endpoint)
-        total = initial_response.get("count", 0)
-        total_pages = (total // page_size) + (1 if total % page_size else 0)
-        logger.info(
-            f"Total physical objects on territory: {total}, Total number of pages: {total_pages}"
-        )
-
-        urls = [
-            f"/api/v1/territory/{territory_id}/physical_objects_with_geometry?page={i}&page_size={page_size}"
-            for i in range(1, total_pages + 1)
-        ]
-
-        semaphore = asyncio.Semaphore(5)
-
-        async def fetch_page_with_sem(url: str) -> dict:
-            async with semaphore:
-                data = await self.requests_handler.get(url)
-                logger.info(f"Page {url} has been loaded")
-                return data
-
-        tasks = [fetch_page_with_sem(url) for url in urls]
-        pages = await asyncio.gather(*tasks)
-
-        results = []
-        for page in pages:
-            results.extend(page.get("results", []))
-        return results
+    def iter_physical_objects_from_territory_pages(self, territory_id: int):
+        """
+        Yields `(page_number, objects)` for every page of territory physical objects
+        as soon as the page is downloaded.
+        """
+        endpoint = f"/api/v1/territory/{territory_id}/physical_objects_with_geometry"
+        return self.paginator.iter_pages(endpoint)
 
 
     async def get_territory_boundaries(self, territory_id: int) -> dict:
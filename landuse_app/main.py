@@ -7,7 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 from starlette.responses import RedirectResponse
 
-from landuse_app.dependencies import consumer, producer, config
+from landuse_app.dependencies import consumer, producer, config, http_session, caching_service, cache_maintenance, scenario_cache
 from landuse_app.handlers.indicators_controller import indicators_router
 from landuse_app.handlers.landuse_percentages_controller import landuse_percentages_router
 from landuse_app.handlers.renovation_controller import renovation_router
@@ -22,13 +22,19 @@ controllers = [indicators_router, landuse_percentages_router, urbanization_route
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    await http_session.start()
     await consumer.start(["scenario.events"])
     await producer.start()
+    await cache_maintenance.start()
     try:
         yield
     finally:
+        await cache_maintenance.stop()
         await consumer.stop()
+        await scenario_cache.stop()
         await producer.stop()
+        await caching_service.close()
+        await http_session.stop()
 
 
 
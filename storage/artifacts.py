@@ -0,0 +1,221 @@
+import math
+import os
+import string
+import uuid
+from abc import abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from numbers import Number
+from pathlib import Path
+from typing import Any
+
+import geopandas as gpd
+import pandas as pd
+import pyarrow as pa
+
+from landuse_app.common import json_codec
+from storage.interfaces import Cacheable
+
+DATE_FORMAT = "%Y-%m-%d-%H-%M-%S"
+
+
+class CachedArtifact(Cacheable):
+    """
+    A value together with the serializer used to store it in the cache directory.
+
+    Subclasses declare the file `suffix`, the `value_type` they accept and how the
+    value is written to and read from a file.
+    """
+
+    suffix: str = ""
+    value_type: type | tuple[type, ...] = object
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    @classmethod
+    def file_name(cls, name: str, date: datetime) -> str:
+        return f"{date.strftime(DATE_FORMAT)}_{name}{cls.suffix}"
+
+    @classmethod
+    def accepts(cls, value: Any) -> bool:
+        return isinstance(value, cls.value_type)
+
+    def to_file(self, path: Path, name: str, date: datetime, *args) -> None:
+        self.write_atomic(path / self.file_name(name, date))
+
+    def write_atomic(self, file_path: Path) -> None:
+        """Writes to a temporary file and renames it, so readers never see a partial file."""
+        tmp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            self.write(tmp_path)
+            os.replace(tmp_path, file_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    @abstractmethod
+    def write(self, file_path: Path) -> None:
+        pass
+
+
+class JsonArtifact(CachedArtifact):
+    """Raw JSON documents such as Urban API responses."""
+
+    suffix = ".json"
+    value_type = (dict, list)
+
+    def write(self, file_path: Path) -> None:
+        file_path.write_bytes(json_codec.dumps(self.value))
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> dict | list:
+        return json_codec.loads(file_path.read_bytes())
+
+
+def _encode_json_value(value: Any) -> str | None:
+    if value is None or value is pd.NA or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return json_codec.dumps(value).decode()
+
+
+def _decode_json_value(value: str | None) -> Any:
+    return json_codec.loads(value) if value is not None else None
+
+
+def _needs_json(column: pd.Series) -> bool:
+    """Object columns Arrow cannot type, or would turn into lossy structs and lists."""
+    try:
+        array = pa.array(column, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return True
+    return pa.types.is_nested(array.type)
+
+
+
+class GeoDataFrameArtifact(CachedArtifact):
+    """
+    GeoDataFrames stored as GeoParquet with WKB geometry, keeping dtypes and CRS.
+
+    Object columns Arrow cannot type, such as ids mixing numbers and "Unknown", and
+    columns of nested dicts or lists are stored as JSON text per value under the column
+    name plus `JSON_COLUMN_SUFFIX` and decoded back on read.
+    """
+
+    suffix = ".parquet"
+    value_type = gpd.GeoDataFrame
+    JSON_COLUMN_SUFFIX = "::json"
+
+    def write(self, file_path: Path) -> None:
+        gdf = self.value
+        json_columns = [
+            column
+            for column in gdf.columns
+            if column != gdf.geometry.name
+            and gdf[column].dtype == object
+            and _needs_json(gdf[column])
+        ]
+        if json_columns:
+            gdf = gdf.copy()
+            for column in json_columns:
+                gdf[column] = gdf[column].map(_encode_json_value)
+            gdf = gdf.rename(
+                columns={column: f"{column}{self.JSON_COLUMN_SUFFIX}" for column in json_columns}
+            )
+        gdf.to_parquet(file_path, compression="zstd")
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> gpd.GeoDataFrame:
+        gdf = gpd.read_parquet(file_path)
+        json_columns = {
+            column: column[: -len(cls.JSON_COLUMN_SUFFIX)]
+            for column in gdf.columns
+            if isinstance(column, str) and column.endswith(cls.JSON_COLUMN_SUFFIX)
+        }
+        if json_columns:
+            for column in json_columns:
+                gdf[column] = gdf[column].map(_decode_json_value)
+            gdf = gdf.rename(columns=json_columns)
+        return gdf
+
+
+class ScalarArtifact(CachedArtifact):
+    """
+    Scalar indicator payloads: a number or a flat mapping of names to scalars, such as
+    zone percentages or an indicator value record.
+    """
+
+    suffix = ".scalar.json"
+    value_type = (Number, dict)
+
+    @staticmethod
+    def _is_scalar(value: Any) -> bool:
+        return value is None or isinstance(value, (Number, str, bool))
+
+    @classmethod
+    def accepts(cls, value: Any) -> bool:
+        if isinstance(value, dict):
+            return all(cls._is_scalar(v) for v in value.values())
+        return isinstance(value, Number)
+
+    def write(self, file_path: Path) -> None:
+        file_path.write_bytes(json_codec.dumps({"value": self.value}))
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> Number | dict:
+        return json_codec.loads(file_path.read_bytes())["value"]
+
+
+ARTIFACT_TYPES: list[type[CachedArtifact]] = []
+
+
+def register_artifact(artifact: type[CachedArtifact]) -> type[CachedArtifact]:
+    """Registers a serializer; it can be used as a class decorator."""
+    ARTIFACT_TYPES.append(artifact)
+    ARTIFACT_TYPES.sort(key=lambda a: len(a.suffix), reverse=True)
+    return artifact
+
+
+for _artifact in (JsonArtifact, GeoDataFrameArtifact, ScalarArtifact):
+    register_artifact(_artifact)
+
+
+def artifact_for_file(file_path: Path) -> type[CachedArtifact] | None:
+    """Finds the serializer by the longest matching file suffix."""
+    for artifact in ARTIFACT_TYPES:
+        if file_path.name.endswith(artifact.suffix):
+            return artifact
+    return None
+
+
+def artifact_for_value(value: Any) -> type[CachedArtifact]:
+    """Picks the serializer for a value: GeoDataFrames go to GeoParquet, the rest to JSON."""
+    if GeoDataFrameArtifact.accepts(value):
+        return GeoDataFrameArtifact
+    return JsonArtifact
+
+
+@dataclass(frozen=True)
+class ArtifactSpec:
+    """
+    Declaration of a cached artifact.
+
+    `name` is a format template whose fields identify the artifact; any other fields
+    passed to `key` become cache params. `version` is part of every key, so bumping it
+    invalidates entries written by an older pipeline.
+    """
+
+    name: str
+    artifact: type[CachedArtifact]
+    version: int = 1
+
+    @property
+    def name_fields(self) -> set[str]:
+        return {field for _, field, _, _ in string.Formatter().parse(self.name) if field}
+
+    def key(self, **fields) -> tuple[str, dict]:
+        """Returns the cache (name, params) pair for the given field values."""
+        name_fields = self.name_fields
+        name = self.name.format(**{k: v for k, v in fields.items() if k in name_fields})
+        params = {k: v for k, v in fields.items() if k not in name_fields}
+        params["_v"] = self.version
+        return name, params
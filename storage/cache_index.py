@@ -0,0 +1,176 @@
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """Index record of the most recent cache file for a key."""
+    key: str
+    file_name: str
+    created_at: float
+    size: int
+    last_access: float = 0.0
+    hits: int = 0
+
+
+_COLUMNS = "key, file_name, created_at, size, last_access, hits"
+
+
+class CacheIndex:
+    """
+    SQLite index of cache keys to their most recent file, creation time and size.
+
+    Lookups and updates are single primary-key queries, so their cost does not grow
+    with the number of files in the cache directory.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                file_name TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL DEFAULT 0,
+                hits INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS data_versions (
+                scope TEXT PRIMARY KEY,
+                version INTEGER NOT NULL
+            )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(entries)")}
+        for column, ddl in (
+            ("last_access", "REAL NOT NULL DEFAULT 0"),
+            ("hits", "INTEGER NOT NULL DEFAULT 0"),
+        ):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE entries ADD COLUMN {column} {ddl}")
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def put(self, entry: CacheEntry) -> CacheEntry | None:
+        """Stores the entry and returns the one it replaced, if any."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM entries WHERE key = ?", (entry.key,)
+                ).fetchone()
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO entries ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        entry.key,
+                        entry.file_name,
+                        entry.created_at,
+                        entry.size,
+                        entry.last_access or entry.created_at,
+                        entry.hits,
+                    ),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return CacheEntry(*row) if row else None
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def delete_if_file(self, key: str, file_name: str) -> bool:
+        """Deletes the entry only if it still points to `file_name`; returns whether it did."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE key = ? AND file_name = ?", (key, file_name)
+            )
+        return cursor.rowcount > 0
+
+    def touch(self, key: str, at: float) -> None:
+        """Records a read of the entry for LRU/LFU eviction."""
+        self.touch_many({key: (at, 1)})
+
+    def touch_many(self, accesses: dict[str, tuple[float, int]]) -> None:
+        """Records reads batched as `{key: (last_access, hits)}` in one transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "UPDATE entries SET last_access = max(last_access, ?), hits = hits + ? "
+                    "WHERE key = ?",
+                    [(at, hits, key) for key, (at, hits) in accesses.items()],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def entries(self, order_by: str | None = None) -> list[CacheEntry]:
+        """
+        Returns all entries; `order_by` is "lru" (least recently read first) or "lfu"
+        (least frequently read first, ties broken by recency).
+        """
+        order = {
+            None: "",
+            "lru": " ORDER BY last_access ASC",
+            "lfu": " ORDER BY hits ASC, last_access ASC",
+        }[order_by]
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {_COLUMNS} FROM entries{order}").fetchall()
+        return [CacheEntry(*row) for row in rows]
+
+    def entries_with_prefix(self, prefix: str) -> list[CacheEntry]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM entries WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            ).fetchall()
+        return [CacheEntry(*row) for row in rows]
+
+    def total_size(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def data_version(self, scope: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version FROM data_versions WHERE scope = ?", (scope,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def bump_data_version(self, scope: str) -> int:
+        """Increments the data version of a scope (e.g. a scenario) and returns the new one."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO data_versions (scope, version) VALUES (?, 1) "
+                "ON CONFLICT(scope) DO UPDATE SET version = version + 1",
+                (scope,),
+            )
+            row = self._conn.execute(
+                "SELECT version FROM data_versions WHERE scope = ?", (scope,)
+            ).fetchone()
+        return row[0]
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM entries LIMIT 1").fetchone() is None
@@ -1,89 +1,711 @@
-import json
+import asyncio
+import contextvars
 import re
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any, Awaitable, Callable
 
 from loguru import logger
 
 from landuse_app import config
+from landuse_app.common import json_codec
+from storage.artifacts import (
+    DATE_FORMAT,
+    ArtifactSpec,
+    CachedArtifact,
+    GeoDataFrameArtifact,
+    JsonArtifact,
+    artifact_for_file,
+    artifact_for_value,
+)
+from storage.cache_index import CacheEntry, CacheIndex
+from storage.file_lease import FileLease, LeaseManager
+from storage.memory_cache import MemoryLRUCache, estimate_size
+
+# Set inside background revalidations: values computed there must not be built from
+# stale entries of nested artifacts, which would then be trusted for another soft TTL
+_revalidating: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "cache_revalidating", default=False
+)
 
 
 class CachingService:
-    def __init__(self, cache_path: Path, cache_enabled: bool = True):
+    DATE_FORMAT = DATE_FORMAT
+    EVICTION_POLICIES = ("lru", "lfu")
+    # Unindexed files younger than this may be writes that are not indexed yet
+    ORPHAN_GRACE_SECONDS = 600
+
+    def __init__(
+        self,
+        cache_path: Path,
+        cache_enabled: bool = True,
+        memory_max_bytes: int = 256 * 1024 * 1024,
+        max_disk_bytes: int | None = None,
+        eviction_policy: str = "lru",
+        soft_ttl: float | None = None,
+        hard_ttl: float | None = None,
+        lease_timeout: float = 600.0,
+    ):
+        if eviction_policy not in self.EVICTION_POLICIES:
+            raise ValueError(
+                f"Unknown cache eviction policy {eviction_policy!r}, "
+                f"expected one of {self.EVICTION_POLICIES}"
+            )
         self.cache_enabled = cache_enabled
         self.refresh_days: int = 3
+        # Entries older than soft_ttl are stale: `get_or_compute_artifact` still serves them
+        # until hard_ttl while recomputing in the background. Equal TTLs disable this.
+        self.soft_ttl = (
+            soft_ttl if soft_ttl is not None else timedelta(days=self.refresh_days).total_seconds()
+        )
+        self.hard_ttl = max(hard_ttl or 0.0, self.soft_ttl)
+        self._revalidations: dict[str, asyncio.Task] = {}
+        self.lease_timeout = lease_timeout
+        self.max_disk_bytes = max_disk_bytes
+        self.eviction_policy = eviction_policy
+        self.memory = MemoryLRUCache(memory_max_bytes)
+        self._pending_writes: set[asyncio.Task] = set()
+        # Reads are recorded here and written to the index in batches off the event loop
+        self._accesses: dict[str, tuple[float, int]] = {}
+        self._accesses_lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+        self.orphans_removed = 0
         if self.cache_enabled:
             self.cache_path = cache_path
             self.cache_path.mkdir(parents=True, exist_ok=True)
+            self.index = CacheIndex(self.cache_path / "cache_index.sqlite3")
+            self.leases = LeaseManager(self.cache_path / "locks")
+            if self.index.is_empty():
+                self._rebuild_index()
         else:
             self.cache_path = None
+            self.index = None
+            self.leases = None
 
     def _sanitize_filename(self, name: str) -> str:
         return re.sub(r'[<>:"/\\|?*&]', "", name)
 
-    def get_cache_file_path(self, name: str, params: dict) -> Path:
-        if not self.cache_enabled:
-            return None
+    def _cache_key(self, name: str, params: dict) -> str:
         sanitized_name = self._sanitize_filename(name)
         param_string = "_".join([f"{k}-{v}" for k, v in sorted(params.items())])
-        date = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-        return self.cache_path / f"{date}_{sanitized_name}_{param_string}.json"
+        return f"{sanitized_name}_{param_string}"
+
+    def _rebuild_index(self) -> None:
+        """Indexes cache files written before the index existed, keeping the newest per key."""
+        date_length = len(datetime.now().strftime(self.DATE_FORMAT))
+        latest: dict[str, Path] = {}
+        for file in self.cache_path.iterdir():
+            artifact = artifact_for_file(file)
+            if artifact is None or file.name.startswith("."):
+                continue
+            stem = file.name[: -len(artifact.suffix)]
+            if len(stem) <= date_length or stem[date_length] != "_":
+                continue
+            key = stem[date_length + 1:]
+            if key not in latest or file.name > latest[key].name:
+                latest[key] = file
+        for key, file in latest.items():
+            stat = file.stat()
+            self.index.put(CacheEntry(key, file.name, stat.st_mtime, stat.st_size))
+        if latest:
+            logger.info(f"Cache index rebuilt with {len(latest)} entries")
+
+    def get_cache_file_path(
+        self, name: str, params: dict, artifact: type[CachedArtifact] = JsonArtifact
+    ) -> Path:
+        if not self.cache_enabled:
+            return None
+        return self.cache_path / artifact.file_name(self._cache_key(name, params), datetime.now())
 
     def is_cache_valid(self, file_path: Path) -> bool:
         if not self.cache_enabled or not file_path or not file_path.exists():
             return False
-        file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-        return datetime.now() - file_time < timedelta(days=self.refresh_days)
+        return time.time() - file_path.stat().st_mtime < self.soft_ttl
 
-    def save_cache(self, data: dict, file_path: Path) -> None:
+    def save_cache(self, data: Any, file_path: Path) -> bool:
+        """
+        Saves data to file_path atomically with the serializer registered for its suffix.
+        """
         if not self.cache_enabled or not file_path:
-            return
+            return False
+        artifact = artifact_for_file(file_path)
+        if artifact is None:
+            logger.warning(f"Нет сериализатора для кэш-файла {file_path}")
+            return False
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
+            artifact(data).write_atomic(file_path)
+            return True
         except Exception as e:
             logger.warning(f"Ошибка при сохранении кэша в {file_path}: {e}")
+            return False
 
-    def load_cache(self, file_path: Path) -> dict:
+    def load_cache(self, file_path: Path) -> Any:
         if not self.cache_enabled or not file_path or not file_path.exists():
             return {}
+        artifact = artifact_for_file(file_path)
+        if artifact is None:
+            return {}
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return artifact.from_file(file_path)
         except Exception as e:
             logger.warning(f"Ошибка при загрузке кэша из {file_path}: {e}")
             return {}
 
+    async def load_cache_async(self, file_path: Path) -> Any:
+        """Same as `load_cache`, with reading and parsing in a worker thread."""
+        return await asyncio.to_thread(self.load_cache, file_path)
+
+    def data_version(self, scope: str) -> int:
+        """
+        Current version of the source data of a scope such as `scenario-<id>`. Artifacts
+        derived from that data include it in their key; bumping it invalidates them.
+        """
+        if not self.cache_enabled:
+            return 0
+        return self.index.data_version(scope)
+
+    async def data_version_async(self, scope: str) -> int:
+        """Same as `data_version`, with the index query in a worker thread."""
+        return await asyncio.to_thread(self.data_version, scope)
+
+    def bump_data_version(self, scope: str) -> int:
+        if not self.cache_enabled:
+            return 0
+        return self.index.bump_data_version(scope)
+
+    def invalidate_prefix(self, name_prefix: str) -> int:
+        """
+        Removes all entries whose cache name starts with `name_prefix` from both tiers.
+        Blocking; run it in a worker thread from async code.
+
+        Returns:
+            int: number of removed disk entries.
+        """
+        if not self.cache_enabled:
+            return 0
+        removed = 0
+        for entry in self.index.entries_with_prefix(self._sanitize_filename(name_prefix)):
+            self.memory.pop(entry.key)
+            if self.index.delete_if_file(entry.key, entry.file_name):
+                self._remove_file(self.cache_path / entry.file_name)
+                removed += 1
+        return removed
+
     def get_recent_cache_file(self, name: str, params: dict) -> Path:
         if not self.cache_enabled:
             return None
-        sanitized_name = self._sanitize_filename(name)
-        param_string = "_".join([f"{k}-{v}" for k, v in sorted(params.items())])
-        pattern = f"*_{sanitized_name}_{param_string}.json"
-        matching_files = sorted(self.cache_path.glob(pattern), reverse=True)
-        return matching_files[0] if matching_files else None
+        key = self._cache_key(name, params)
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        self._record_access(key)
+        return self.cache_path / entry.file_name
+
+    def _record_access(self, key: str) -> None:
+        with self._accesses_lock:
+            _, hits = self._accesses.get(key, (0.0, 0))
+            self._accesses[key] = (time.time(), hits + 1)
+
+    def _flush_accesses(self) -> None:
+        """Writes the recorded reads to the index. Blocking; run it in a worker thread."""
+        with self._accesses_lock:
+            accesses, self._accesses = self._accesses, {}
+        if accesses:
+            self.index.touch_many(accesses)
+
+    def _remove_file(self, file: Path) -> None:
+        try:
+            file.unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"Ошибка при удалении файла {file}: {e}")
 
     def clean_cache(self, name: str, params: dict) -> None:
         if not self.cache_enabled:
             return
-        sanitized_name = self._sanitize_filename(name)
-        param_string = "_".join([f"{k}-{v}" for k, v in sorted(params.items())])
-        pattern = f"*_{sanitized_name}_{param_string}.json"
-        matching_files = self.cache_path.glob(pattern)
-        for file in matching_files:
-            if not self.is_cache_valid(file):
-                logger.info(f"Удаление устаревшего кэш-файла: {file}")
-                try:
-                    file.unlink()
-                except Exception as e:
-                    logger.warning(f"Ошибка при удалении файла {file}: {e}")
-
-    def save_with_cleanup(self, data: dict, name: str, params: dict) -> None:
+        key = self._cache_key(name, params)
+        entry = self.index.get(key)
+        if entry is None:
+            return
+        file = self.cache_path / entry.file_name
+        if not self.is_cache_valid(file):
+            logger.info(f"Удаление устаревшего кэш-файла: {file}")
+            self.index.delete(key)
+            self._remove_file(file)
+
+    def save_with_cleanup(
+        self,
+        data: Any,
+        name: str,
+        params: dict,
+        artifact: type[CachedArtifact] | None = None,
+    ) -> None:
         if not self.cache_enabled:
             return
-        self.clean_cache(name, params)
-        file_path = self.get_cache_file_path(name, params)
-        self.save_cache(data, file_path)
+        key = self._cache_key(name, params)
+        artifact = artifact or artifact_for_value(data)
+        file_path = self.get_cache_file_path(name, params, artifact)
+        saved = self.save_cache(data, file_path)
+        if not saved and artifact is not JsonArtifact and GeoDataFrameArtifact.accepts(data):
+            logger.warning(f"Falling back to GeoJSON cache for {key}")
+            file_path = self.get_cache_file_path(name, params)
+            # GeoJSON has no CRS, so the fallback is always written in WGS 84
+            geojson = data.to_json(to_wgs84=data.crs is not None)
+            saved = self.save_cache(json_codec.loads(geojson), file_path)
+        if not saved:
+            return
+        self.memory.pop(key)
+        stat = file_path.stat()
+        replaced = self.index.put(CacheEntry(key, file_path.name, stat.st_mtime, stat.st_size))
+        if replaced is not None and replaced.file_name != file_path.name:
+            self._remove_file(self.cache_path / replaced.file_name)
+
+    def get_object(
+        self, name: str, params: dict, decode: Callable[[dict], Any] | None = None
+    ) -> Any | None:
+        """
+        Two-tier lookup of a ready-to-use object.
+
+        The in-memory LRU tier is checked first; on a miss the most recent valid disk entry
+        is loaded and promoted to the memory tier. JSON entries are turned into objects with
+        `decode`, binary (GeoParquet) entries are loaded as GeoDataFrames directly.
+        Returns None if neither tier has a valid entry. Callers must not mutate the result.
+        """
+        if not self.cache_enabled:
+            return None
+        entry = self._get_from_memory(name, params, self.soft_ttl)
+        if entry is None:
+            entry = self._get_from_disk(name, params, decode, self.soft_ttl)
+        return entry[0] if entry is not None else None
+
+    async def get_object_async(
+        self, name: str, params: dict, decode: Callable[[dict], Any] | None = None
+    ) -> Any | None:
+        """
+        Same as `get_object`, but reading and decoding a disk entry runs in a worker
+        thread, so a large entry does not block the event loop.
+        """
+        if not self.cache_enabled:
+            return None
+        entry = await self._get_entry_async(name, params, decode, self.soft_ttl)
+        return entry[0] if entry is not None else None
+
+    async def _get_entry_async(
+        self,
+        name: str,
+        params: dict,
+        decode: Callable[[dict], Any] | None,
+        max_age: float,
+    ) -> tuple[Any, float] | None:
+        entry = self._get_from_memory(name, params, max_age)
+        if entry is None:
+            entry = await asyncio.to_thread(self._get_from_disk, name, params, decode, max_age)
+        return entry
+
+    def _get_from_memory(
+        self, name: str, params: dict, max_age: float
+    ) -> tuple[Any, float] | None:
+        key = self._cache_key(name, params)
+        entry = self.memory.get_entry(key, max_age=max_age)
+        if entry is None:
+            return None
+        self._record_access(key)
+        return entry
+
+    def _get_from_disk(
+        self,
+        name: str,
+        params: dict,
+        decode: Callable[[dict], Any] | None,
+        max_age: float,
+    ) -> tuple[Any, float] | None:
+        cache_file = self.get_recent_cache_file(name, params)
+        if not cache_file or not cache_file.exists():
+            return None
+        created_at = cache_file.stat().st_mtime
+        if time.time() - created_at >= max_age:
+            return None
+        value = self.load_cache(cache_file)
+        if isinstance(value, dict) and artifact_for_file(cache_file) is JsonArtifact:
+            if not value:
+                return None
+            if decode is not None:
+                value = decode(value)
+        self.memory.put(self._cache_key(name, params), value, created_at=created_at)
+        return value, created_at
+
+    def _remember(self, name: str, params: dict, value: Any) -> None:
+        """Puts a just-saved object into the memory tier."""
+        self.memory.put(self._cache_key(name, params), value)
+
+    async def _remember_async(self, name: str, params: dict, value: Any) -> None:
+        """Same as `_remember`, with the size estimate (a pass over the data) in a worker thread."""
+        size = await asyncio.to_thread(estimate_size, value)
+        self.memory.put(self._cache_key(name, params), value, size=size)
+
+    def save_object(
+        self,
+        value: Any,
+        name: str,
+        params: dict,
+        encode: Callable[[Any], dict] | None = None,
+        artifact: type[CachedArtifact] | None = None,
+    ) -> None:
+        """
+        Saves the object to disk and keeps the object itself in memory. GeoDataFrames
+        are written as GeoParquet as is; other objects are converted with `encode` first.
+        `artifact` forces a specific serializer instead of picking one by value type.
+        """
+        if not self.cache_enabled:
+            return
+        payload = value if encode is None else encode(value)
+        self.save_with_cleanup(payload, name, params, artifact)
+        self._remember(name, params, value)
+
+    def save_object_background(
+        self,
+        value: Any,
+        name: str,
+        params: dict,
+        encode: Callable[[Any], dict] | None = None,
+        artifact: type[CachedArtifact] | None = None,
+    ) -> None:
+        """
+        Write-behind variant of `save_object`: sizing the object for the memory tier,
+        serialization and the disk write run in a worker thread.
+        Must be called from the event loop; the caller must not mutate `value` afterwards.
+        """
+        if not self.cache_enabled:
+            return
+        self._write_behind(self.save_object, value, name, params, encode, artifact)
+
+    def save_with_cleanup_background(
+        self,
+        data: Any,
+        name: str,
+        params: dict,
+        artifact: type[CachedArtifact] | None = None,
+    ) -> None:
+        """Write-behind variant of `save_with_cleanup`."""
+        if not self.cache_enabled:
+            return
+        self._write_behind(self.save_with_cleanup, data, name, params, artifact)
+
+    def _write_behind(self, write: Callable[..., None], *args) -> None:
+        task = asyncio.create_task(asyncio.to_thread(write, *args))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._on_write_done)
+
+    def _on_write_done(self, task: asyncio.Task) -> None:
+        self._pending_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Ошибка фоновой записи кэша: {task.exception()}")
+
+    async def flush(self) -> None:
+        """Waits for all pending write-behind saves, e.g. before shutdown."""
+        while self._pending_writes:
+            await asyncio.gather(*list(self._pending_writes), return_exceptions=True)
+
+    def get_artifact(
+        self, spec: ArtifactSpec, decode: Callable[[dict], Any] | None = None, **fields
+    ) -> Any | None:
+        """
+        Typed lookup of an artifact declared by `spec`; `fields` fill the spec's name
+        template and the remaining ones become cache params.
+        """
+        name, params = spec.key(**fields)
+        value = self.get_object(name, params, decode)
+        if value is not None and not spec.artifact.accepts(value):
+            return None
+        return value
+
+    async def get_artifact_async(
+        self, spec: ArtifactSpec, decode: Callable[[dict], Any] | None = None, **fields
+    ) -> Any | None:
+        """Same as `get_artifact`, with disk reads off the event loop."""
+        name, params = spec.key(**fields)
+        value = await self.get_object_async(name, params, decode)
+        if value is not None and not spec.artifact.accepts(value):
+            return None
+        return value
+
+    def save_artifact(
+        self, spec: ArtifactSpec, value: Any, background: bool = False, **fields
+    ) -> None:
+        """
+        Saves a value under the key declared by `spec` with the spec's serializer.
+        With `background` the disk write is done write-behind (see `save_object_background`).
+        """
+        if not spec.artifact.accepts(value):
+            raise TypeError(
+                f"{type(value).__name__} cannot be cached as {spec.artifact.__name__}"
+            )
+        name, params = spec.key(**fields)
+        if background:
+            self.save_object_background(value, name, params, artifact=spec.artifact)
+        else:
+            self.save_object(value, name, params, artifact=spec.artifact)
+
+    async def get_or_compute_artifact(
+        self,
+        spec: ArtifactSpec,
+        compute: Callable[[], Awaitable[Any]],
+        decode: Callable[[dict], Any] | None = None,
+        **fields,
+    ) -> Any:
+        """
+        Stale-while-revalidate lookup of an artifact declared by `spec`.
+
+        A fresh entry (younger than `soft_ttl`) is returned as is. A stale entry that is
+        younger than `hard_ttl` is returned immediately as well, and a single background
+        task per key recomputes it with `compute`. Without a usable entry the value is
+        computed in place and saved write-behind. Lookups made by `compute` inside such a
+        background recomputation do not serve stale entries.
+
+        Parameters:
+            spec (ArtifactSpec): declaration of the cached artifact.
+            compute (Callable[[], Awaitable[Any]]): coroutine factory producing a fresh value.
+            decode (Callable[[dict], Any] | None): decoder for legacy JSON entries.
+            **fields: key fields of the artifact.
+
+        Returns:
+            Any: cached or freshly computed value. Callers must not mutate it.
+        """
+        name, params = spec.key(**fields)
+        if not self.cache_enabled:
+            return await compute()
+        max_age = self.soft_ttl if _revalidating.get() else self.hard_ttl
+        value = await self._get_usable(spec, compute, decode, name, params, max_age)
+        if value is not None:
+            return value
+        return await self._compute_with_lease(spec, compute, decode, name, params, max_age)
+
+    async def _get_usable(
+        self,
+        spec: ArtifactSpec,
+        compute: Callable[[], Awaitable[Any]],
+        decode: Callable[[dict], Any] | None,
+        name: str,
+        params: dict,
+        max_age: float,
+    ) -> Any | None:
+        """Returns an entry younger than `max_age`, scheduling a revalidation if it is stale."""
+        entry = await self._get_entry_async(name, params, decode, max_age)
+        if entry is None or not spec.artifact.accepts(entry[0]):
+            return None
+        value, created_at = entry
+        if time.time() - created_at >= self.soft_ttl:
+            self._revalidate(spec, compute, name, params)
+        return value
+
+    async def _compute_with_lease(
+        self,
+        spec: ArtifactSpec,
+        compute: Callable[[], Awaitable[Any]],
+        decode: Callable[[dict], Any] | None,
+        name: str,
+        params: dict,
+        max_age: float,
+    ) -> Any:
+        """
+        Computes a missing entry while holding the key's lease, so that one process (or
+        request) computes it and the others wait and then read the saved entry. The lease
+        is released once the entry is on disk. If the lease cannot be acquired within
+        `lease_timeout`, the value is computed without it.
+        """
+        key = self._cache_key(name, params)
+        lease = self.leases.lease(key)
+        acquired = await lease.acquire(self.lease_timeout)
+        if not acquired:
+            logger.warning(f"Timed out waiting for cache lease on {key}, computing without it")
+        try:
+            if acquired:
+                value = await self._get_usable(spec, compute, decode, name, params, max_age)
+                if value is not None:
+                    lease.release()
+                    return value
+            value = await compute()
+        except BaseException:
+            lease.release()
+            raise
+        await self._save_under_lease(lease, value, name, params, spec.artifact)
+        return value
+
+    async def _save_under_lease(
+        self,
+        lease: FileLease,
+        value: Any,
+        name: str,
+        params: dict,
+        artifact: type[CachedArtifact],
+    ) -> None:
+        """Write-behind save that releases `lease` after the entry is written."""
+        try:
+            await self._remember_async(name, params, value)
+        except BaseException:
+            lease.release()
+            raise
+
+        def save_and_release() -> None:
+            try:
+                self.save_object(value, name, params, artifact=artifact)
+            finally:
+                lease.release()
+
+        self._write_behind(save_and_release)
+
+    def _revalidate(
+        self,
+        spec: ArtifactSpec,
+        compute: Callable[[], Awaitable[Any]],
+        name: str,
+        params: dict,
+    ) -> None:
+        key = self._cache_key(name, params)
+        if key in self._revalidations:
+            return
+        logger.info(f"Serving stale cache for {key}, recomputing in background")
+        task = asyncio.create_task(self._recompute(spec, compute, name, params))
+        self._revalidations[key] = task
+        task.add_done_callback(lambda _: self._revalidations.pop(key, None))
+
+    async def _recompute(
+        self,
+        spec: ArtifactSpec,
+        compute: Callable[[], Awaitable[Any]],
+        name: str,
+        params: dict,
+    ) -> None:
+        """
+        Recomputes a stale entry unless another process holds the key's lease or has
+        already refreshed the entry; in both cases the stale value keeps being served.
+        """
+        key = self._cache_key(name, params)
+        lease = self.leases.lease(key)
+        if not lease.try_acquire():
+            return
+        _revalidating.set(True)
+        try:
+            entry = await asyncio.to_thread(self.index.get, key)
+            if entry is not None and time.time() - entry.created_at < self.soft_ttl:
+                lease.release()
+                return
+            value = await compute()
+        except Exception as e:
+            lease.release()
+            logger.warning(f"Ошибка фонового пересчёта кэша {name}: {e}")
+            return
+        except BaseException:
+            lease.release()
+            raise
+        await self._save_under_lease(lease, value, name, params, spec.artifact)
+
+    async def close(self) -> None:
+        """Cancels background recomputations and waits for pending writes."""
+        for task in list(self._revalidations.values()):
+            task.cancel()
+        await asyncio.gather(*self._revalidations.values(), return_exceptions=True)
+        await self.flush()
+        if self.cache_enabled:
+            await asyncio.to_thread(self._flush_accesses)
+
+    def run_maintenance(self) -> dict:
+        """
+        One maintenance pass over the whole cache directory.
+
+        Removes entries of all keys that are older than `hard_ttl` or lost their file,
+        evicts entries by the eviction policy until the disk quota is met and deletes files
+        the index does not reference as well as idle lease lock files. Blocking; run it in
+        a worker thread.
+
+        Returns:
+            dict: cache statistics after the pass (see `stats`).
+        """
+        if not self.cache_enabled:
+            return {}
+        lease = self.leases.lease("__maintenance__")
+        if not lease.try_acquire():
+            logger.info("Cache maintenance is running in another process, skipping")
+            return self.stats()
+        try:
+            return self._run_maintenance()
+        finally:
+            lease.release()
+
+    def _run_maintenance(self) -> dict:
+        self._flush_accesses()
+        now = time.time()
+        expired = evicted = 0
+
+        live = []
+        for entry in self.index.entries(self.eviction_policy):
+            file = self.cache_path / entry.file_name
+            if now - entry.created_at < self.hard_ttl and file.exists():
+                live.append(entry)
+            elif self.index.delete_if_file(entry.key, entry.file_name):
+                self._remove_file(file)
+                self.memory.pop(entry.key)
+                expired += 1
+
+        if self.max_disk_bytes is not None:
+            total = sum(entry.size for entry in live)
+            for entry in live:
+                if total <= self.max_disk_bytes:
+                    break
+                if self.index.delete_if_file(entry.key, entry.file_name):
+                    self._remove_file(self.cache_path / entry.file_name)
+                    self.memory.pop(entry.key)
+                    total -= entry.size
+                    evicted += 1
+
+        orphans = self._remove_orphans(now)
+        locks = self.leases.remove_idle(self.ORPHAN_GRACE_SECONDS)
+        self.expirations += expired
+        self.evictions += evicted
+        self.orphans_removed += orphans
+        stats = self.stats()
+        logger.info(
+            f"Cache maintenance: {stats['entries']} entries, {stats['bytes']} bytes; "
+            f"expired {expired}, evicted {evicted}, orphans removed {orphans}, "
+            f"idle lock files removed {locks}"
+        )
+        return stats
+
+    def _remove_orphans(self, now: float) -> int:
+        """Deletes cache and temporary files that are not referenced by the index."""
+        referenced = {entry.file_name for entry in self.index.entries()}
+        removed = 0
+        for file in self.cache_path.iterdir():
+            is_tmp = file.name.startswith(".") and file.name.endswith(".tmp")
+            if not is_tmp and (artifact_for_file(file) is None or file.name in referenced):
+                continue
+            try:
+                if now - file.stat().st_mtime < self.ORPHAN_GRACE_SECONDS:
+                    continue
+            except FileNotFoundError:
+                continue
+            self._remove_file(file)
+            removed += 1
+        return removed
+
+    def stats(self) -> dict:
+        if not self.cache_enabled:
+            return {"enabled": False}
+        entries = self.index.entries()
+        return {
+            "enabled": True,
+            "entries": len(entries),
+            "bytes": self.index.total_size(),
+            "max_bytes": self.max_disk_bytes,
+            "eviction_policy": self.eviction_policy,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "orphans_removed": self.orphans_removed,
+            "pending_writes": len(self._pending_writes),
+            "memory": self.memory.stats(),
+        }
 
 
 # cache_enabled = config.get_bool("CACHE_ENABLED")  # должен вернуть True или False
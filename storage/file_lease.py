@@ -0,0 +1,117 @@
+import asyncio
+import hashlib
+import os
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process coordination, every lease is granted
+    fcntl = None
+
+
+class FileLease:
+    """
+    Exclusive lease on a cache key shared by all processes using the same cache directory.
+
+    Backed by `flock` on a lock file, so a lease is released by the OS if its holder dies.
+    flock locks belong to an open file description, so two leases on the same file also
+    exclude each other within one process.
+
+    Idle lock files may be deleted by `LeaseManager.remove_idle`. A lock taken on a file
+    that was unlinked in the meantime is dropped and taken again on the current file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd: int | None = None
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        if self._fd is not None:
+            return True
+        if fcntl is None:
+            self._fd = -1
+            return True
+        while True:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                return False
+            if self._is_current(fd):
+                self._fd = fd
+                return True
+            os.close(fd)
+
+    def _is_current(self, fd: int) -> bool:
+        """Whether the locked file is still the one at `path`, i.e. was not removed."""
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        locked = os.fstat(fd)
+        return (locked.st_dev, locked.st_ino) == (current.st_dev, current.st_ino)
+
+    async def acquire(self, timeout: float, poll_interval: float = 0.2) -> bool:
+        """Waits up to `timeout` seconds for the lease; returns whether it was acquired."""
+        deadline = time.monotonic() + timeout
+        while not self.try_acquire():
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(poll_interval)
+        return True
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        if self._fd >= 0:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+        self._fd = None
+
+
+class LeaseManager:
+    """
+    Hands out leases for cache keys. Every key has its own lock file named by the digest
+    of the key, so leases on different keys never wait for each other; `remove_idle`
+    keeps the lock directory from growing with the number of keys.
+    """
+
+    def __init__(self, lock_dir: Path):
+        self.lock_dir = lock_dir
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+
+    def lease(self, key: str) -> FileLease:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return FileLease(self.lock_dir / f"{digest}.lock")
+
+    def remove_idle(self, min_age: float) -> int:
+        """
+        Deletes lock files not touched for `min_age` seconds that nobody holds. Each file
+        is locked before it is unlinked, so a current holder keeps its lease.
+
+        Returns:
+            int: number of removed lock files.
+        """
+        removed = 0
+        now = time.time()
+        for file in self.lock_dir.glob("*.lock"):
+            try:
+                if now - file.stat().st_mtime < min_age:
+                    continue
+            except FileNotFoundError:
+                continue
+            lease = FileLease(file)
+            if not lease.try_acquire():
+                continue
+            try:
+                file.unlink(missing_ok=True)
+                removed += 1
+            finally:
+                lease.release()
+        return removed
@@ -0,0 +1,43 @@
+import hashlib
+from typing import Any
+
+import geopandas as gpd
+import pandas as pd
+import shapely
+
+from landuse_app.common import json_codec
+
+
+def _update_with_frame(digest: "hashlib._Hash", df: pd.DataFrame) -> None:
+    geometry_column = df.geometry.name if isinstance(df, gpd.GeoDataFrame) else None
+    attributes = df.drop(columns=[geometry_column]) if geometry_column else df
+    object_columns = attributes.select_dtypes(include="object").columns
+    if len(object_columns):
+        # nested values (dicts, lists) are not hashable by pandas
+        attributes = attributes.copy()
+        attributes[object_columns] = attributes[object_columns].astype(str)
+    digest.update(json_codec.dumps([str(c) for c in df.columns]))
+    digest.update(pd.util.hash_pandas_object(attributes, index=True).to_numpy().tobytes())
+    if geometry_column:
+        digest.update(str(df.crs).encode("utf-8"))
+        for wkb in shapely.to_wkb(df.geometry.to_numpy()):
+            digest.update(wkb or b"\0")
+
+
+def fingerprint(*parts: Any) -> str:
+    """
+    Content hash of stage inputs: (Geo)DataFrames are hashed by columns, index, values and
+    WKB geometry, other parts by their JSON representation. Row order matters.
+
+    Returns:
+        str: hex digest usable as a cache key field.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, pd.DataFrame):
+            digest.update(b"frame")
+            _update_with_frame(digest, part)
+        else:
+            digest.update(b"value")
+            digest.update(json_codec.dumps(part))
+    return digest.hexdigest()
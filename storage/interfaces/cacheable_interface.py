@@ -7,3 +7,8 @@ class Cacheable(ABC):
     @abstractmethod
     def to_file(self, path: Path, name: str, date: datetime, *args) -> None:
         pass
+
+    @classmethod
+    @abstractmethod
+    def from_file(cls, file_path: Path):
+        pass
@@ -0,0 +1,96 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import pandas as pd
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Rough in-memory size of a cached object in bytes.
+
+    For (Geo)DataFrames the attribute columns are measured with pandas and each geometry
+    is counted as 16 bytes per coordinate plus a fixed per-object overhead.
+    """
+    if isinstance(value, pd.DataFrame):
+        geometry_column = getattr(value, "_geometry_column_name", None)
+        attributes = value.drop(columns=[geometry_column]) if geometry_column in value else value
+        size = int(attributes.memory_usage(deep=True).sum())
+        if geometry_column in value:
+            geometries = value[geometry_column]
+            size += int(geometries.count_coordinates().sum()) * 16 + len(geometries) * 100
+        return size
+    return sys.getsizeof(value)
+
+
+class MemoryLRUCache:
+    """
+    In-process LRU cache of ready-to-use objects bounded by their total estimated size.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[Any, int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, max_age: float | None = None) -> Any | None:
+        """Returns the cached object, or None if it is missing or older than `max_age` seconds."""
+        entry = self.get_entry(key, max_age)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str, max_age: float | None = None) -> tuple[Any, float] | None:
+        """Same as `get`, but returns the object together with its creation time."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and max_age is not None and time.time() - entry[2] >= max_age:
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0], entry[2]
+
+    def put(
+        self, key: str, value: Any, size: int | None = None, created_at: float | None = None
+    ) -> None:
+        """Stores the object; `created_at` (epoch seconds) defaults to now and drives `max_age`."""
+        size = estimate_size(value) if size is None else size
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size, created_at or time.time())
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,19 @@
+import pytest
+
+
+class StrictConfig:
+    """Mimics iduconfig's Config, which raises ValueError for unset keys."""
+
+    def __init__(self, **values):
+        self.values = values
+
+    def get(self, key: str):
+        if key not in self.values:
+            raise ValueError(f"No such env: {key}")
+        return self.values[key]
+
+
+@pytest.fixture
+def strict_config():
+    """Factory of configs holding only the given settings."""
+    return StrictConfig
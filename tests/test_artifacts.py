@@ -0,0 +1,95 @@
+import geopandas as gpd
+import pandas as pd
+import pytest
+from shapely import Point, Polygon
+
+from storage.artifacts import (
+    GeoDataFrameArtifact,
+    JsonArtifact,
+    ScalarArtifact,
+    artifact_for_file,
+    artifact_for_value,
+)
+
+
+def make_frame() -> gpd.GeoDataFrame:
+    return gpd.GeoDataFrame(
+        {
+            "physical_object_id": [1, 2, 3],
+            "storeys_count": pd.array([5, None, 9], dtype="Int64"),
+            "area": [10.5, float("nan"), 3.25],
+            "zone": ["residential", None, "industrial"],
+            "building_id": [17, "Unknown", None],
+            "properties": [{"levels": 5, "tags": ["a"]}, None, {"levels": None}],
+            "service_ids": [[1, 2], [], None],
+        },
+        geometry=[
+            Point(0, 0),
+            Polygon([(0, 0), (1, 0), (1, 1)]),
+            Point(2, 2),
+        ],
+        crs="EPSG:32636",
+    )
+
+
+def test_geodataframe_round_trip_keeps_values_dtypes_and_crs(tmp_path):
+    gdf = make_frame()
+    path = tmp_path / f"frame{GeoDataFrameArtifact.suffix}"
+
+    GeoDataFrameArtifact(gdf).write_atomic(path)
+    restored = GeoDataFrameArtifact.from_file(path)
+
+    assert list(restored.columns) == list(gdf.columns)
+    assert restored.crs == gdf.crs
+    assert restored.geometry.name == "geometry"
+    assert restored.geometry.geom_equals(gdf.geometry).all()
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(restored.drop(columns="geometry")),
+        pd.DataFrame(gdf.drop(columns="geometry")),
+    )
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_json_columns_are_marked_in_file(tmp_path):
+    path = tmp_path / f"frame{GeoDataFrameArtifact.suffix}"
+
+    GeoDataFrameArtifact(make_frame()).write(path)
+
+    suffix = GeoDataFrameArtifact.JSON_COLUMN_SUFFIX
+    stored = set(gpd.read_parquet(path).columns)
+    assert {f"building_id{suffix}", f"properties{suffix}", f"service_ids{suffix}"} <= stored
+    assert {"zone", "area", "storeys_count"} <= stored
+
+
+def test_frame_without_crs_round_trips(tmp_path):
+    gdf = gpd.GeoDataFrame({"value": [1]}, geometry=[Point(1, 1)])
+    path = tmp_path / f"frame{GeoDataFrameArtifact.suffix}"
+
+    GeoDataFrameArtifact(gdf).write(path)
+
+    assert GeoDataFrameArtifact.from_file(path).crs is None
+
+
+@pytest.mark.parametrize(
+    "value, artifact",
+    [
+        ({"count": 2, "results": [{"id": 1}, {"id": 2}]}, JsonArtifact),
+        ({"residential": 0.5, "industrial": None}, ScalarArtifact),
+        (42.5, ScalarArtifact),
+    ],
+)
+def test_json_payloads_round_trip(tmp_path, value, artifact):
+    path = tmp_path / f"payload{artifact.suffix}"
+
+    artifact(value).write_atomic(path)
+
+    assert artifact_for_file(path) is artifact
+    assert artifact.from_file(path) == value
+
+
+def test_serializer_is_picked_by_value_and_suffix(tmp_path):
+    assert artifact_for_value(make_frame()) is GeoDataFrameArtifact
+    assert artifact_for_value({"features": []}) is JsonArtifact
+    assert artifact_for_file(tmp_path / "x.scalar.json") is ScalarArtifact
+    assert artifact_for_file(tmp_path / "x.json") is JsonArtifact
+    assert artifact_for_file(tmp_path / "x.txt") is None
@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+import jwt
+import pytest
+
+from landuse_app.logic.api.urban_db_api_client import AuthService
+
+SIGNING_KEY = "test-signing-key-of-at-least-32-bytes"
+
+
+def make_token(expires_in: float) -> str:
+    return jwt.encode({"exp": int(time.time() + expires_in)}, SIGNING_KEY, algorithm="HS256")
+
+
+class RecordingConfigUtils:
+    def __init__(self):
+        self.saved = []
+
+    def set_many(self, values: dict) -> None:
+        self.saved.append(values)
+
+
+class FakeTokenServer:
+    """Issues a new token pair per refresh; refreshes are held until `release` is set."""
+
+    def __init__(self, expires_in: float = 3600):
+        self.expires_in = expires_in
+        self.refreshes = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def refresh(self, refresh_token: str) -> dict:
+        self.refreshes += 1
+        await self.release.wait()
+        return {
+            "access_token": make_token(self.expires_in + self.refreshes),
+            "refresh_token": make_token(86400),
+        }
+
+
+@pytest.fixture
+def token_server():
+    return FakeTokenServer()
+
+
+def make_auth(strict_config, token_server: FakeTokenServer, expiry_margin: float = 60.0):
+    config = strict_config(ACCESS_TOKEN=make_token(-10), REFRESH_TOKEN=make_token(86400))
+    auth = AuthService("http://auth.local", config, RecordingConfigUtils(), None, expiry_margin)
+    auth._refresh = token_server.refresh
+    return auth
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_refresh(strict_config, token_server):
+    auth = make_auth(strict_config, token_server)
+    token_server.release.clear()
+
+    callers = [asyncio.create_task(auth.validate_and_refresh()) for _ in range(10)]
+    await asyncio.sleep(0.01)
+    token_server.release.set()
+    tokens = await asyncio.gather(*callers)
+    await asyncio.gather(*auth._persist_tasks)
+
+    assert token_server.refreshes == 1
+    assert len(set(tokens)) == 1
+    assert len(auth.utilsconfig.saved) == 1
+    assert auth.utilsconfig.saved[0]["ACCESS_TOKEN"] == tokens[0]
+
+
+@pytest.mark.asyncio
+async def test_valid_token_is_served_from_memory(strict_config, token_server):
+    auth = make_auth(strict_config, token_server)
+
+    first = await auth.validate_and_refresh()
+    assert await auth.validate_and_refresh() == first
+    assert token_server.refreshes == 1
+
+
+@pytest.mark.asyncio
+async def test_token_within_expiry_margin_is_refreshed(strict_config):
+    token_server = FakeTokenServer(expires_in=30)
+    auth = make_auth(strict_config, token_server, expiry_margin=60)
+
+    first = await auth.validate_and_refresh()
+    second = await auth.validate_and_refresh()
+
+    assert first != second
+    assert token_server.refreshes == 2
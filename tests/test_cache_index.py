@@ -0,0 +1,72 @@
+from storage.cache_index import CacheEntry, CacheIndex
+
+
+def make_index(tmp_path) -> CacheIndex:
+    return CacheIndex(tmp_path / "cache_index.sqlite3")
+
+
+def test_put_replaces_entry_and_returns_previous(tmp_path):
+    index = make_index(tmp_path)
+    assert index.is_empty()
+    assert index.put(CacheEntry("key", "old.json", 1.0, 10)) is None
+
+    replaced = index.put(CacheEntry("key", "new.json", 2.0, 20))
+
+    assert replaced.file_name == "old.json"
+    assert index.get("key").file_name == "new.json"
+    assert index.total_size() == 20
+    assert not index.is_empty()
+
+
+def test_delete_if_file_keeps_entry_pointing_to_newer_file(tmp_path):
+    index = make_index(tmp_path)
+    index.put(CacheEntry("key", "new.json", 2.0, 20))
+
+    assert not index.delete_if_file("key", "old.json")
+    assert index.get("key") is not None
+    assert index.delete_if_file("key", "new.json")
+    assert index.get("key") is None
+
+
+def test_entries_with_prefix_treats_prefix_literally(tmp_path):
+    index = make_index(tmp_path)
+    index.put(CacheEntry("scenario_1_zones", "a.json", 1.0, 1))
+    index.put(CacheEntry("scenario_10_zones", "b.json", 1.0, 1))
+    index.put(CacheEntry("scenario%_x", "c.json", 1.0, 1))
+
+    assert [e.key for e in index.entries_with_prefix("scenario_1_")] == ["scenario_1_zones"]
+    assert [e.key for e in index.entries_with_prefix("scenario%")] == ["scenario%_x"]
+
+
+def test_eviction_order_by_recency_and_frequency(tmp_path):
+    index = make_index(tmp_path)
+    for key, created_at in (("a", 1.0), ("b", 2.0), ("c", 3.0)):
+        index.put(CacheEntry(key, f"{key}.json", created_at, 1))
+    index.touch_many({"a": (10.0, 3), "c": (5.0, 1)})
+    index.touch("a", 11.0)
+
+    assert [e.key for e in index.entries("lru")] == ["b", "c", "a"]
+    assert [e.key for e in index.entries("lfu")] == ["b", "c", "a"]
+    assert index.get("a").hits == 4
+    assert index.get("a").last_access == 11.0
+
+
+def test_touch_many_keeps_latest_access_time(tmp_path):
+    index = make_index(tmp_path)
+    index.put(CacheEntry("key", "key.json", 1.0, 1))
+    index.touch("key", 20.0)
+    index.touch_many({"key": (10.0, 1), "missing": (10.0, 1)})
+
+    assert index.get("key").last_access == 20.0
+    assert index.get("missing") is None
+
+
+def test_data_versions_are_per_scope_and_persistent(tmp_path):
+    index = make_index(tmp_path)
+    assert index.data_version("scenario-1") == 0
+    assert index.bump_data_version("scenario-1") == 1
+    assert index.bump_data_version("scenario-1") == 2
+
+    reopened = make_index(tmp_path)
+    assert reopened.data_version("scenario-1") == 2
+    assert reopened.data_version("scenario-2") == 0
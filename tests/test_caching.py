@@ -0,0 +1,219 @@
+import asyncio
+import dataclasses
+import time
+
+import pytest
+
+from storage.artifacts import ArtifactSpec, JsonArtifact
+from storage.caching import CachingService
+
+SPEC = ArtifactSpec("scenario_{scenario_id}_summary", JsonArtifact)
+
+
+class Clock:
+    """Wall clock of the cache modules that tests can move forward."""
+
+    def __init__(self):
+        self.offset = 0.0
+
+    def time(self) -> float:
+        return time.time() + self.offset
+
+
+class Computation:
+    """Counts calls of a compute coroutine; each call can be held until `release` is set."""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> dict:
+        self.calls += 1
+        await self.release.wait()
+        return {"version": self.calls}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("storage.caching.time", clock)
+    monkeypatch.setattr("storage.memory_cache.time", clock)
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CachingService(tmp_path, soft_ttl=60, hard_ttl=600)
+
+
+async def lookup(cache: CachingService, compute: Computation) -> dict:
+    return await cache.get_or_compute_artifact(SPEC, compute, scenario_id=1)
+
+
+async def settle(cache: CachingService) -> None:
+    await asyncio.gather(*cache._revalidations.values())
+    await cache.flush()
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_is_served_without_recomputing(cache, clock):
+    compute = Computation()
+    assert await lookup(cache, compute) == {"version": 1}
+    await cache.flush()
+
+    clock.offset = 30
+    assert await lookup(cache, compute) == {"version": 1}
+    assert compute.calls == 1
+    assert not cache._revalidations
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_refreshing_in_background(cache, clock):
+    compute = Computation()
+    await lookup(cache, compute)
+    await cache.flush()
+
+    clock.offset = 120
+    compute.release.clear()
+    assert await lookup(cache, compute) == {"version": 1}
+    assert len(cache._revalidations) == 1
+
+    compute.release.set()
+    await settle(cache)
+    assert await lookup(cache, compute) == {"version": 2}
+    assert compute.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_refreshed_once_at_a_time(cache, clock):
+    compute = Computation()
+    await lookup(cache, compute)
+    await cache.flush()
+    recomputations = []
+    recompute = cache._recompute
+
+    async def counting_recompute(*args):
+        recomputations.append(args)
+        await recompute(*args)
+
+    cache._recompute = counting_recompute
+
+    clock.offset = 120
+    compute.release.clear()
+    stale = await asyncio.gather(*(lookup(cache, compute) for _ in range(5)))
+    await asyncio.sleep(0.05)
+
+    assert stale == [{"version": 1}] * 5
+    assert len(recomputations) == 1
+    assert compute.calls == 2
+    compute.release.set()
+    await settle(cache)
+    assert compute.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_entry_past_hard_ttl_is_recomputed_in_place(cache, clock):
+    compute = Computation()
+    await lookup(cache, compute)
+    await cache.flush()
+
+    clock.offset = 601
+    assert await lookup(cache, compute) == {"version": 2}
+    assert not cache._revalidations
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_serving_stale_entry(cache, clock):
+    await lookup(cache, Computation())
+    await cache.flush()
+
+    async def failing() -> dict:
+        raise RuntimeError("Urban API is down")
+
+    clock.offset = 120
+    assert await cache.get_or_compute_artifact(SPEC, failing, scenario_id=1) == {"version": 1}
+    await settle(cache)
+    assert await cache.get_or_compute_artifact(SPEC, failing, scenario_id=1) == {"version": 1}
+    await settle(cache)
+
+
+@pytest.mark.asyncio
+async def test_lookup_waits_for_lease_holder_and_reads_its_entry(tmp_path):
+    cache = CachingService(tmp_path, lease_timeout=5)
+    other_process = CachingService(tmp_path, lease_timeout=5)
+    name, params = SPEC.key(scenario_id=1)
+    holder = other_process.leases.lease(other_process._cache_key(name, params))
+    holder.try_acquire()
+    compute = Computation()
+
+    waiter = asyncio.create_task(lookup(cache, compute))
+    await asyncio.sleep(0.05)
+    other_process.save_artifact(SPEC, {"version": 0}, scenario_id=1)
+    holder.release()
+
+    assert await waiter == {"version": 0}
+    assert compute.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_lookup_computes_without_lease_after_timeout(tmp_path):
+    cache = CachingService(tmp_path, lease_timeout=0.1)
+    name, params = SPEC.key(scenario_id=1)
+    holder = cache.leases.lease(cache._cache_key(name, params))
+    holder.try_acquire()
+    compute = Computation()
+
+    assert await lookup(cache, compute) == {"version": 1}
+    await cache.flush()
+    assert compute.calls == 1
+    holder.release()
+
+
+def fill_quota_cache(tmp_path, clock, policy: str, reads: dict[str, int]) -> CachingService:
+    """Saves entries a, b and c of equal size, then reads them `reads` times in order."""
+    cache = CachingService(tmp_path, eviction_policy=policy)
+    for name in ("a", "b", "c"):
+        cache.save_object({"value": name}, name, {})
+    for name, count in reads.items():
+        for _ in range(count):
+            clock.offset += 10
+            cache.get_object(name, {})
+    entry_size = cache.index.get(cache._cache_key("a", {})).size
+    cache.max_disk_bytes = entry_size
+    return cache
+
+
+def test_quota_evicts_least_recently_read_first(tmp_path, clock):
+    cache = fill_quota_cache(tmp_path, clock, "lru", {"c": 3, "a": 1})
+
+    stats = cache.run_maintenance()
+
+    assert [entry.key for entry in cache.index.entries()] == [cache._cache_key("a", {})]
+    assert cache.evictions == 2
+    assert stats["entries"] == 1
+    assert cache.get_object("b", {}) is None
+
+
+def test_quota_evicts_least_frequently_read_first(tmp_path, clock):
+    cache = fill_quota_cache(tmp_path, clock, "lfu", {"c": 3, "a": 1})
+
+    cache.run_maintenance()
+
+    assert [entry.key for entry in cache.index.entries()] == [cache._cache_key("c", {})]
+    assert cache.get_object("c", {}) == {"value": "c"}
+    assert cache.get_object("a", {}) is None
+
+
+def test_expired_entries_are_removed_before_quota_eviction(tmp_path):
+    cache = CachingService(tmp_path, soft_ttl=60, hard_ttl=600)
+    cache.save_object({"value": "old"}, "old", {})
+    old = cache.index.get(cache._cache_key("old", {}))
+    cache.index.put(dataclasses.replace(old, created_at=old.created_at - 601))
+    cache.save_object({"value": "new"}, "new", {})
+    cache.max_disk_bytes = cache.index.total_size()
+
+    cache.run_maintenance()
+
+    assert [entry.key for entry in cache.index.entries()] == [cache._cache_key("new", {})]
+    assert (cache.expirations, cache.evictions) == (1, 0)
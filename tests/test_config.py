@@ -0,0 +1,36 @@
+import pytest
+
+from landuse_app.common.session_wrapper import SessionWrapper
+from landuse_app.config import config_number, config_value
+
+
+def test_unset_settings_fall_back_to_defaults(strict_config):
+    config = strict_config(EMPTY="")
+
+    assert config_value(config, "MISSING") is None
+    assert config_value(config, "MISSING", "lru") == "lru"
+    assert config_value(config, "EMPTY", "lru") == "lru"
+    assert config_number(config, "MISSING", None) is None
+    assert config_number(config, "MISSING", 2.5, float) == 2.5
+
+
+def test_set_settings_are_cast(strict_config):
+    config = strict_config(LIMIT="16", RATIO="0.5", POLICY="lfu")
+
+    assert config_number(config, "LIMIT", 1) == 16
+    assert config_number(config, "RATIO", 1.0, float) == 0.5
+    assert config_value(config, "POLICY", "lru") == "lfu"
+
+
+def test_malformed_number_is_reported(strict_config):
+    with pytest.raises(ValueError):
+        config_number(strict_config(LIMIT="many"), "LIMIT", 1)
+
+
+def test_session_wrapper_defaults_with_minimal_config(strict_config):
+    session = SessionWrapper.from_config(strict_config(LOG_FILE="app", CACHE_ENABLED="1"))
+
+    assert session.limit == 100
+    assert session.limit_per_host == 20
+    assert session.timeout.total == 600.0
+    assert session.timeout.sock_read is None
@@ -0,0 +1,96 @@
+import importlib
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("iduconfig")
+pytest.importorskip("otteroad")
+
+# settings every deployment defines; all tuning settings are optional
+REQUIRED_SETTINGS = {
+    "LOG_FILE": "landuse",
+    "CACHE_ENABLED": "1",
+    "AUTH_SERVICE_URL": "http://auth.local",
+    "URBAN_API": "http://urban-api.local",
+}
+OPTIONAL_SETTINGS = (
+    "HTTP_POOL_LIMIT",
+    "HTTP_POOL_LIMIT_PER_HOST",
+    "HTTP_DNS_CACHE_TTL",
+    "HTTP_KEEPALIVE_TIMEOUT",
+    "HTTP_TOTAL_TIMEOUT",
+    "HTTP_CONNECT_TIMEOUT",
+    "HTTP_READ_TIMEOUT",
+    "TOKEN_EXPIRY_MARGIN",
+    "URBAN_API_MAX_ATTEMPTS",
+    "URBAN_API_BACKOFF_BASE",
+    "URBAN_API_BACKOFF_MAX",
+    "URBAN_API_DEADLINE",
+    "URBAN_API_TIMEOUT",
+    "URBAN_API_HEAVY_TIMEOUT",
+    "URBAN_API_SOCK_READ_TIMEOUT",
+    "URBAN_API_ENDPOINT_TIMEOUTS",
+    "URBAN_API_BREAKER_THRESHOLD",
+    "URBAN_API_BREAKER_RESET",
+    "PAGE_SIZE",
+    "PAGE_SIZE_MIN",
+    "PAGE_SIZE_MAX",
+    "PAGE_TARGET_LATENCY",
+    "PAGE_RETRY_ROUNDS",
+    "PAGINATION_CONCURRENCY",
+    "PAGINATION_MIN_CONCURRENCY",
+    "PAGINATION_MAX_CONCURRENCY",
+    "STREAM_LARGE_RESPONSES",
+    "MEMORY_CACHE_MAX_MB",
+    "CACHE_MAX_SIZE_MB",
+    "CACHE_EVICTION_POLICY",
+    "CACHE_SOFT_TTL",
+    "CACHE_HARD_TTL",
+    "CACHE_LEASE_TIMEOUT",
+    "CACHE_MAINTENANCE_INTERVAL",
+    "CACHE_CONTENT_ADDRESSED",
+    "CACHE_WARM_UP_ON_EVENTS",
+    "PIPELINE_QUEUE_SIZE",
+    "STOREYS_IMPUTATION",
+    "PHYSICAL_OBJECT_AREA_CLASSES",
+)
+
+
+def test_dependencies_build_with_minimal_env(tmp_path, monkeypatch):
+    from landuse_app.common.consumer_wrapper import ConsumerWrapper
+    from landuse_app.common.producer_wrapper import ProducerWrapper
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env").write_text(
+        "".join(f"{key}={value}\n" for key, value in REQUIRED_SETTINGS.items())
+    )
+    for key, value in REQUIRED_SETTINGS.items():
+        monkeypatch.setenv(key, value)
+    for key in OPTIONAL_SETTINGS:
+        monkeypatch.delenv(key, raising=False)
+    # the Kafka clients are not under test and need a broker
+    monkeypatch.setattr(
+        ConsumerWrapper,
+        "__init__",
+        lambda self: setattr(
+            self, "consumer_service", types.SimpleNamespace(register_handler=lambda h: None)
+        ),
+    )
+    monkeypatch.setattr(
+        ProducerWrapper,
+        "__init__",
+        lambda self: setattr(self, "producer_service", None),
+    )
+    monkeypatch.delitem(sys.modules, "landuse_app.dependencies", raising=False)
+
+    dependencies = importlib.import_module("landuse_app.dependencies")
+
+    assert dependencies.caching_service.eviction_policy == "lru"
+    assert dependencies.caching_service.max_disk_bytes is None
+    assert dependencies.auth_service.expiry_margin == 60.0
+    assert dependencies.http_session.limit == 100
+    assert dependencies.paginator.default_page_size == 5000
+    assert not dependencies.urban_api.stream_responses
+    assert dependencies.preprocessing_service.storeys_imputation == "object_id"
+    monkeypatch.delitem(sys.modules, "landuse_app.dependencies")
@@ -0,0 +1,91 @@
+import asyncio
+import subprocess
+import sys
+import time
+
+import pytest
+
+from storage.file_lease import FileLease, LeaseManager
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="leases are not exclusive without flock"
+)
+
+HOLD_LOCK = """
+import fcntl, os, sys, time
+fd = os.open(sys.argv[1], os.O_RDWR | os.O_CREAT)
+fcntl.flock(fd, fcntl.LOCK_EX)
+print("locked", flush=True)
+time.sleep(60)
+"""
+
+
+@pytest.fixture
+def leases(tmp_path):
+    return LeaseManager(tmp_path / "locks")
+
+
+def test_lease_is_exclusive_until_released(leases):
+    first, second = leases.lease("key"), leases.lease("key")
+
+    assert first.try_acquire()
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    assert leases.lease("other").try_acquire()
+
+    first.release()
+    assert not first.held
+    assert second.try_acquire()
+    second.release()
+
+
+@pytest.mark.asyncio
+async def test_acquire_times_out_while_lease_is_held(leases):
+    holder = leases.lease("key")
+    holder.try_acquire()
+
+    started = time.monotonic()
+    assert not await leases.lease("key").acquire(timeout=0.2, poll_interval=0.05)
+    assert time.monotonic() - started >= 0.2
+    holder.release()
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_release(leases):
+    holder = leases.lease("key")
+    holder.try_acquire()
+    waiter = leases.lease("key")
+
+    asyncio.get_running_loop().call_later(0.1, holder.release)
+    assert await waiter.acquire(timeout=5, poll_interval=0.02)
+    waiter.release()
+
+
+@pytest.mark.asyncio
+async def test_lease_of_dead_process_is_taken_over(leases):
+    lease = leases.lease("key")
+    holder = subprocess.Popen(
+        [sys.executable, "-c", HOLD_LOCK, str(lease.path)], stdout=subprocess.PIPE, text=True
+    )
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        assert not await lease.acquire(timeout=0.1, poll_interval=0.02)
+    finally:
+        holder.kill()
+        holder.wait()
+
+    assert await lease.acquire(timeout=5, poll_interval=0.02)
+    lease.release()
+
+
+def test_remove_idle_keeps_held_lock_files(leases):
+    held, idle = leases.lease("held"), leases.lease("idle")
+    held.try_acquire()
+    idle.try_acquire()
+    idle.release()
+
+    assert leases.remove_idle(min_age=0) == 1
+    assert held.path.exists()
+    assert not idle.path.exists()
+    held.release()
+
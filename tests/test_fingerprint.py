@@ -0,0 +1,40 @@
+import geopandas as gpd
+from shapely import Point
+
+from storage.fingerprint import fingerprint
+
+
+def make_frame(**overrides) -> gpd.GeoDataFrame:
+    data = {
+        "zone": ["residential", "industrial"],
+        "properties": [{"storeys": 5}, None],
+        "geometry": [Point(0, 0), Point(1, 1)],
+    }
+    data.update(overrides)
+    return gpd.GeoDataFrame(data, crs="EPSG:4326")
+
+
+def test_equal_inputs_have_equal_fingerprints():
+    assert fingerprint(make_frame(), {"profile": "x"}) == fingerprint(
+        make_frame(), {"profile": "x"}
+    )
+
+
+def test_any_change_of_input_changes_fingerprint():
+    base = fingerprint(make_frame(), {"profile": "x"})
+    variants = [
+        fingerprint(make_frame(zone=["residential", "business"]), {"profile": "x"}),
+        fingerprint(make_frame(properties=[{"storeys": 6}, None]), {"profile": "x"}),
+        fingerprint(make_frame(geometry=[Point(0, 0), Point(1, 2)]), {"profile": "x"}),
+        fingerprint(make_frame().to_crs(3857), {"profile": "x"}),
+        fingerprint(make_frame().rename(columns={"zone": "landuse"}), {"profile": "x"}),
+        fingerprint(make_frame(), {"profile": "y"}),
+        fingerprint({"profile": "x"}, make_frame()),
+    ]
+    assert base not in variants
+    assert len(set(variants)) == len(variants)
+
+
+def test_row_order_matters():
+    frame = make_frame()
+    assert fingerprint(frame) != fingerprint(frame.iloc[::-1])
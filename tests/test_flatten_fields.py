@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+from landuse_app.logic.constants.constants import NestedField, SERVICE_FIELDS
+from landuse_app.logic.helpers.preprocessing_service import PreProcessingService
+
+SPEC = {
+    "type_id": NestedField(("zone_type", "id"), "Int64"),
+    "type_name": NestedField(("zone_type", "name")),
+    "label": NestedField(("label",), default="unknown"),
+}
+
+
+def test_nested_values_are_flattened_per_record():
+    columns = PreProcessingService.flatten_fields(
+        [
+            {"zone_type": {"id": 1, "name": "residential"}, "label": "a"},
+            {"zone_type": {"id": 2, "name": "industrial"}, "label": "b"},
+        ],
+        SPEC,
+    )
+
+    assert list(columns) == ["type_id", "type_name", "label"]
+    assert columns["type_id"].tolist() == [1, 2]
+    assert columns["type_name"].tolist() == ["residential", "industrial"]
+    assert columns["label"].tolist() == ["a", "b"]
+
+
+def test_missing_values_and_non_dict_parents_become_defaults():
+    columns = PreProcessingService.flatten_fields(
+        [
+            {},
+            {"zone_type": None, "label": None},
+            {"zone_type": 5},
+            {"zone_type": {"id": None}},
+        ],
+        SPEC,
+    )
+
+    assert columns["type_id"].isna().all()
+    assert columns["type_name"].tolist() == [None] * 4
+    assert columns["label"].tolist() == ["unknown"] * 4
+
+
+def test_falsy_values_are_kept():
+    columns = PreProcessingService.flatten_fields(
+        [{"zone_type": {"id": 0, "name": ""}, "label": 0}], SPEC
+    )
+
+    assert columns["type_id"].tolist() == [0]
+    assert columns["type_name"].tolist() == [""]
+    assert columns["label"].tolist() == [0]
+
+
+def test_column_types_follow_field_dtype():
+    columns = PreProcessingService.flatten_fields(
+        [{"service_type": {"service_type_id": 3}, "capacity": 10}], SERVICE_FIELDS
+    )
+
+    assert columns["service_type_id"].dtype == pd.Int64Dtype()
+    assert isinstance(columns["capacity"], np.ndarray)
+    assert columns["capacity"].dtype == object
+
+
+def test_no_records_give_empty_columns():
+    columns = PreProcessingService.flatten_fields([], SPEC)
+
+    assert {name: len(values) for name, values in columns.items()} == dict.fromkeys(SPEC, 0)
+    assert columns["type_id"].dtype == pd.Int64Dtype()
@@ -0,0 +1,65 @@
+import time
+
+import geopandas as gpd
+import pandas as pd
+from shapely import Point, Polygon
+
+from storage.memory_cache import MemoryLRUCache, estimate_size
+
+
+def test_evicts_least_recently_used_entries_over_budget():
+    cache = MemoryLRUCache(max_bytes=300)
+    cache.put("a", "a", size=100)
+    cache.put("b", "b", size=100)
+    cache.put("c", "c", size=100)
+    assert cache.get("a") == "a"
+
+    cache.put("d", "d", size=100)
+
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in "acd"] == ["a", "c", "d"]
+    assert cache.current_bytes == 300
+    assert cache.evictions == 1
+
+
+def test_entry_larger_than_budget_is_not_stored():
+    cache = MemoryLRUCache(max_bytes=100)
+    cache.put("small", "small", size=50)
+    cache.put("huge", "huge", size=101)
+
+    assert cache.get("huge") is None
+    assert cache.get("small") == "small"
+    assert cache.current_bytes == 50
+
+
+def test_replacing_entry_updates_size():
+    cache = MemoryLRUCache(max_bytes=1000)
+    cache.put("key", "v1", size=400)
+    cache.put("key", "v2", size=100)
+    cache.pop("missing")
+
+    assert cache.get("key") == "v2"
+    assert cache.current_bytes == 100
+    cache.pop("key")
+    assert cache.current_bytes == 0
+
+
+def test_entries_older_than_max_age_are_dropped():
+    cache = MemoryLRUCache(max_bytes=1000)
+    cache.put("old", "old", size=10, created_at=time.time() - 60)
+    cache.put("new", "new", size=10)
+
+    assert cache.get_entry("old", max_age=30) is None
+    assert cache.get("new", max_age=30) == "new"
+    assert cache.current_bytes == 10
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_estimated_size_grows_with_geometry_coordinates():
+    square = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+    points = gpd.GeoDataFrame({"id": [1, 2]}, geometry=[Point(0, 0)] * 2)
+    squares = gpd.GeoDataFrame({"id": [1, 2]}, geometry=[square] * 2)
+
+    assert estimate_size(squares) - estimate_size(points) == 2 * (5 - 1) * 16
+    assert estimate_size(pd.DataFrame({"id": range(1000)})) >= 8000
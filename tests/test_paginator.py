@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from landuse_app.logic.api.paginator import AdaptivePaginator, AIMDLimiter
+
+
+class FakeRequestsHandler:
+    """Serves `total` numbered items page by page; pages in `failures` fail that many times."""
+
+    def __init__(self, total: int, failures: dict[int, int] | None = None):
+        self.total = total
+        self.failures = dict(failures or {})
+        self.requests = []
+
+    async def get(self, endpoint: str, params: dict = None) -> dict:
+        page, page_size = params["page"], params["page_size"]
+        self.requests.append((page, page_size))
+        await asyncio.sleep(0)
+        if self.failures.get(page):
+            self.failures[page] -= 1
+            raise RuntimeError(f"page {page} failed")
+        start = (page - 1) * page_size
+        return {
+            "count": self.total,
+            "results": list(range(start, min(start + page_size, self.total))),
+        }
+
+
+def test_limiter_grows_additively_and_shrinks_multiplicatively():
+    limiter = AIMDLimiter(initial=4, minimum=1, maximum=5, target_latency=1.0)
+    for _ in range(4):
+        limiter.on_success(0.1)
+    assert limiter.limit == pytest.approx(5.0, abs=0.1)
+
+    limiter.on_error()
+    assert limiter.limit == pytest.approx(2.5, abs=0.1)
+    limiter.on_success(5.0)
+    assert limiter.limit == pytest.approx(1.25, abs=0.1)
+    limiter.on_error()
+    assert limiter.limit == 1
+
+
+def test_limiter_respects_bounds():
+    limiter = AIMDLimiter(initial=100, minimum=2, maximum=8)
+    assert limiter.limit == 8
+    for _ in range(100):
+        limiter.on_success(0.0)
+    assert limiter.limit == 8
+    for _ in range(10):
+        limiter.on_error()
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_bounds_concurrency():
+    limiter = AIMDLimiter(initial=2, minimum=1, maximum=2)
+    running = peak = 0
+
+    async def work():
+        nonlocal running, peak
+        async with limiter:
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(work() for _ in range(6)))
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+def test_page_sizes_move_along_fixed_ladder():
+    paginator = AdaptivePaginator(
+        FakeRequestsHandler(0),
+        default_page_size=5000,
+        min_page_size=500,
+        max_page_size=20000,
+        target_latency=10.0,
+    )
+    assert paginator._page_size_steps == [625, 1250, 2500, 5000, 10000, 20000]
+
+    # within a factor of two of the target the size, and so the cache key, is kept
+    paginator._learn_page_size("/objects", 5000, 15.0)
+    assert paginator.page_size_for("/objects") == 5000
+    paginator._learn_page_size("/objects", 5000, 30.0)
+    assert paginator.page_size_for("/objects") == 2500
+    paginator._learn_page_size("/objects", 2500, 1.0)
+    assert paginator.page_size_for("/objects") == 5000
+
+
+def test_cache_hit_latency_does_not_change_page_size():
+    paginator = AdaptivePaginator(FakeRequestsHandler(0), target_latency=10.0)
+    paginator._learn_page_size("/objects", 5000, 0.01)
+    assert paginator.page_size_for("/objects") == paginator.default_page_size
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_returns_items_in_page_order():
+    handler = FakeRequestsHandler(total=23)
+    paginator = AdaptivePaginator(handler, default_page_size=5, min_page_size=5)
+
+    assert await paginator.fetch_all("/objects") == list(range(23))
+    assert sorted(page for page, _ in handler.requests) == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_failed_pages_are_retried():
+    handler = FakeRequestsHandler(total=20, failures={3: 1})
+    paginator = AdaptivePaginator(handler, default_page_size=5, min_page_size=5)
+
+    assert await paginator.fetch_all("/objects") == list(range(20))
+    assert [page for page, _ in handler.requests].count(3) == 2
+
+
+@pytest.mark.asyncio
+async def test_page_failing_all_rounds_raises():
+    handler = FakeRequestsHandler(total=20, failures={2: 10})
+    paginator = AdaptivePaginator(
+        handler, default_page_size=5, min_page_size=5, retry_rounds=1
+    )
+
+    with pytest.raises(RuntimeError, match="page 2"):
+        await paginator.fetch_all("/objects")
+
+
+def test_pagination_settings_default_when_unset(strict_config):
+    paginator = AdaptivePaginator.from_config(FakeRequestsHandler(0), strict_config())
+
+    assert paginator.default_page_size == 5000
+    assert paginator.limiter.limit == 5
@@ -0,0 +1,166 @@
+import asyncio
+import types
+
+import pytest
+
+from landuse_app.logic.api.resilience import EndpointTimeouts, RetryPolicy
+from landuse_app.logic.api.urban_db_api_client import RequestHandler, fresh_responses
+from storage.caching import CachingService
+
+
+class FakeUrbanAPI:
+    """Stands in for the HTTP layer of RequestHandler; responses are released on demand."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.error: Exception | None = None
+
+    async def __call__(self, path: str, params: dict = None, ignore_404: bool = False):
+        self.calls.append(path)
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return {"path": path, "call": len(self.calls)}
+
+
+@pytest.fixture
+def urban_api():
+    return FakeUrbanAPI()
+
+
+def make_handler(urban_api: FakeUrbanAPI, cache: CachingService | None = None):
+    handler = RequestHandler("http://urban-api.local", None, None, cache)
+    handler._get_with_retries = urban_api
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_fresh_responses_skip_cached_response(tmp_path, urban_api):
+    cache = CachingService(tmp_path)
+    handler = make_handler(urban_api, cache)
+
+    first = await handler.get("/api/v1/zones")
+    await cache.flush()
+    assert await handler.get("/api/v1/zones") == first
+
+    with fresh_responses():
+        fresh = await handler.get("/api/v1/zones")
+    await cache.flush()
+
+    assert fresh["call"] == 2
+    assert await handler.get("/api/v1/zones") == fresh
+    assert len(urban_api.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_identical_gets_are_coalesced(urban_api):
+    handler = make_handler(urban_api)
+    urban_api.release.clear()
+
+    waiters = [asyncio.create_task(handler.get("/api/v1/zones")) for _ in range(5)]
+    await asyncio.sleep(0)
+    urban_api.release.set()
+    responses = await asyncio.gather(*waiters)
+
+    assert len(urban_api.calls) == 1
+    assert all(response is responses[0] for response in responses)
+    assert handler.coalesced_requests == 4
+    assert not handler._inflight
+
+
+@pytest.mark.asyncio
+async def test_different_params_are_not_coalesced(urban_api):
+    handler = make_handler(urban_api)
+
+    await asyncio.gather(
+        handler.get("/api/v1/zones", params={"page": 1}),
+        handler.get("/api/v1/zones", params={"page": 2}),
+        handler.get("/api/v1/zones", params={"page": 1}, ignore_404=True),
+    )
+
+    assert len(urban_api.calls) == 3
+    assert handler.coalesced_requests == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesced_error_reaches_every_waiter(urban_api):
+    handler = make_handler(urban_api)
+    urban_api.release.clear()
+    urban_api.error = RuntimeError("Urban API is down")
+
+    waiters = [asyncio.create_task(handler.get("/api/v1/zones")) for _ in range(3)]
+    await asyncio.sleep(0)
+    urban_api.release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert len(urban_api.calls) == 1
+    assert all(result is urban_api.error for result in results)
+    assert not handler._inflight
+
+    urban_api.error = None
+    assert (await handler.get("/api/v1/zones"))["call"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_leader_does_not_cancel_the_shared_request(urban_api):
+    handler = make_handler(urban_api)
+    urban_api.release.clear()
+
+    leader = asyncio.create_task(handler.get("/api/v1/zones"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(handler.get("/api/v1/zones"))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    urban_api.release.set()
+
+    assert (await follower)["call"] == 1
+    assert leader.cancelled()
+    assert len(urban_api.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_request_finishes_when_every_waiter_is_cancelled(urban_api):
+    handler = make_handler(urban_api)
+    urban_api.release.clear()
+
+    waiter = asyncio.create_task(handler.get("/api/v1/zones"))
+    await asyncio.sleep(0)
+    shared = handler._inflight[next(iter(handler._inflight))]
+    waiter.cancel()
+    await asyncio.sleep(0)
+    urban_api.release.set()
+    await shared
+
+    assert waiter.cancelled()
+    assert not handler._inflight
+
+
+@pytest.mark.asyncio
+async def test_heavy_endpoint_timeout_is_retried_despite_shorter_deadline(monkeypatch):
+    now = [0.0]
+    clock = types.SimpleNamespace(monotonic=lambda: now[0])
+    monkeypatch.setattr("landuse_app.logic.api.urban_db_api_client.time", clock)
+    handler = RequestHandler(
+        "http://urban-api.local",
+        None,
+        None,
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=0.0, deadline=300.0),
+        timeouts=EndpointTimeouts(heavy=600.0),
+    )
+    attempts = []
+
+    async def send_get(path: str, params: dict = None, ignore_404: bool = False):
+        attempts.append(path)
+        now[0] += 600.0
+        if len(attempts) == 1:
+            raise asyncio.TimeoutError()
+        return {"results": []}
+
+    handler._send_get = send_get
+
+    path = "/api/v1/territory/1/physical_objects_with_geometry"
+    assert await handler._get_with_retries(path) == {"results": []}
+    assert len(attempts) == 2
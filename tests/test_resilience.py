@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from landuse_app.logic.api.resilience import (
+    CircuitBreaker,
+    EndpointTimeouts,
+    RetryPolicy,
+    is_retryable,
+)
+
+
+def open_breaker(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+def expire_reset_timeout(breaker: CircuitBreaker) -> None:
+    breaker.opened_at -= breaker.reset_timeout
+
+
+def test_backoff_is_bounded_by_exponential_cap():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3.0)
+    for attempt, cap in ((1, 0.5), (2, 1.0), (3, 2.0), (4, 3.0), (10, 3.0)):
+        for _ in range(50):
+            assert 0 <= policy.backoff(attempt) <= cap
+
+
+def test_endpoint_timeouts_prefer_overrides_then_heavy_endpoints():
+    timeouts = EndpointTimeouts(
+        default=60, heavy=600, overrides={"physical_objects_with_geometry": 180}
+    )
+    assert timeouts.for_path("/api/v1/territory/1/physical_objects_with_geometry") == 180
+    assert timeouts.for_path("/api/v1/scenarios/1/functional_zones") == 600
+    assert timeouts.for_path("/api/v1/territory/1") == 60
+
+
+def test_retry_deadline_covers_one_full_attempt():
+    policy = RetryPolicy(backoff_max=10.0, deadline=300.0)
+
+    assert policy.deadline_for(60.0) == 300.0
+    assert policy.deadline_for(600.0) == 610.0
+
+
+def test_retryable_errors():
+    assert is_retryable(HTTPException(503))
+    assert is_retryable(HTTPException(429))
+    assert is_retryable(asyncio.TimeoutError())
+    assert not is_retryable(HTTPException(404))
+    assert not is_retryable(ValueError())
+
+
+def test_breaker_opens_after_threshold_and_rejects_calls():
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    assert breaker.before_call() is False
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(HTTPException) as error:
+        breaker.before_call()
+    assert error.value.status_code == 503
+
+
+def test_half_open_breaker_lets_a_single_trial_through():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    open_breaker(breaker)
+    expire_reset_timeout(breaker)
+    assert breaker.state == "half_open"
+
+    assert breaker.before_call() is True
+    with pytest.raises(HTTPException):
+        breaker.before_call()
+
+    breaker.record_success()
+    breaker.end_call(True)
+    assert breaker.state == "closed"
+    assert breaker.before_call() is False
+
+
+def test_failed_trial_opens_breaker_again():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    open_breaker(breaker)
+    expire_reset_timeout(breaker)
+
+    trial = breaker.before_call()
+    breaker.record_failure()
+    breaker.end_call(trial)
+    assert breaker.state == "open"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_releases_half_open_slot():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    open_breaker(breaker)
+    expire_reset_timeout(breaker)
+
+    async def call():
+        trial = breaker.before_call()
+        try:
+            await asyncio.sleep(10)
+        finally:
+            breaker.end_call(trial)
+
+    task = asyncio.create_task(call())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert breaker.state == "half_open"
+    assert breaker.before_call() is True
+
+
+def test_resilience_settings_default_when_unset(strict_config):
+    config = strict_config()
+
+    assert RetryPolicy.from_config(config) == RetryPolicy()
+    assert EndpointTimeouts.from_config(config) == EndpointTimeouts()
+    assert CircuitBreaker.from_config("test", config).failure_threshold == 5
@@ -0,0 +1,76 @@
+import numpy as np
+import shapely
+from shapely import GeometryCollection, LineString, MultiPolygon, Point, Polygon, box
+
+from landuse_app.logic.helpers.spatial_methods import SpatialMethods
+
+BOWTIE = Polygon([(0, 0), (1, 1), (1, 0), (0, 1)])
+SLIVER = Polygon([(0, 0), (1, 0), (2, 0)])
+
+
+def as_array(*geometries) -> np.ndarray:
+    return np.array(list(geometries), dtype=object)
+
+
+def test_polygonal_parts_keeps_only_polygons():
+    parts = SpatialMethods._polygonal_parts(
+        as_array(
+            GeometryCollection([box(0, 0, 1, 1), LineString([(0, 0), (2, 2)])]),
+            GeometryCollection([box(0, 0, 1, 1), box(2, 2, 3, 3), Point(5, 5)]),
+            MultiPolygon([box(0, 0, 1, 1)]),
+            LineString([(0, 0), (1, 1)]),
+        )
+    )
+
+    assert parts[0].equals(box(0, 0, 1, 1)) and parts[0].geom_type == "Polygon"
+    assert parts[1].geom_type == "MultiPolygon" and len(parts[1].geoms) == 2
+    assert parts[2].geom_type == "Polygon"
+    assert parts[3] is None
+
+
+def test_repair_keeps_both_halves_of_self_intersecting_polygon():
+    repaired, report = SpatialMethods.repair_geometries(as_array(BOWTIE))
+
+    assert repaired[0].is_valid
+    assert repaired[0].geom_type == "MultiPolygon"
+    assert repaired[0].area == 0.5
+    assert report == {"invalid": 1, "repaired": 1, "dropped": 0, "type_changed": 1}
+
+
+def test_repair_drops_geometries_without_area_and_keeps_valid_ones():
+    valid = box(0, 0, 1, 1)
+    geometries = as_array(valid, SLIVER, None)
+
+    repaired, report = SpatialMethods.repair_geometries(geometries)
+
+    assert repaired[0] is valid
+    assert repaired[1] is None
+    assert repaired[2] is None
+    assert report == {"invalid": 1, "repaired": 0, "dropped": 1, "type_changed": 0}
+    assert geometries[1] is SLIVER
+
+
+def test_repair_of_valid_array_reports_nothing():
+    geometries = as_array(box(0, 0, 1, 1), Point(0, 0))
+
+    repaired, report = SpatialMethods.repair_geometries(geometries)
+
+    assert repaired is geometries
+    assert report == {"invalid": 0, "repaired": 0, "dropped": 0, "type_changed": 0}
+
+
+def test_geometries_from_geojson_skips_bad_features():
+    geometries = SpatialMethods.geometries_from_geojson(
+        [
+            {"type": "Point", "coordinates": [30.0, 60.0]},
+            None,
+            {"type": "Polygon", "coordinates": "broken"},
+            shapely.geometry.mapping(box(0, 0, 1, 1)),
+        ],
+        ids=[1, 2, 3, 4],
+    )
+
+    assert geometries[0].equals(Point(30, 60))
+    assert geometries[1] is None
+    assert geometries[2] is None
+    assert geometries[3].equals(box(0, 0, 1, 1))
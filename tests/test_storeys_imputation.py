@@ -0,0 +1,82 @@
+import geopandas as gpd
+import pandas as pd
+import pytest
+from shapely import Point
+
+from landuse_app.logic.helpers.preprocessing_service import PreProcessingService
+
+
+def make_buildings(ids, storeys) -> gpd.GeoDataFrame:
+    return gpd.GeoDataFrame(
+        {
+            "physical_object_id": ids,
+            "storeys_count": storeys,
+            "storeys_imputed": [value is None for value in storeys],
+        },
+        geometry=[Point(i, i) for i in range(len(ids))],
+    )
+
+
+def test_object_id_imputation_is_deterministic_and_bounded():
+    ids = list(range(1, 201))
+    first = PreProcessingService.impute_storeys(make_buildings(ids, [None] * 200), "object_id")
+    second = PreProcessingService.impute_storeys(
+        make_buildings(ids[::-1], [None] * 200), "object_id"
+    )
+
+    by_id = dict(zip(first["physical_object_id"], first["storeys_count"]))
+    assert by_id == dict(zip(second["physical_object_id"], second["storeys_count"]))
+    assert set(by_id.values()) == {2, 3, 4, 5}
+
+
+def test_known_storeys_are_not_changed():
+    gdf = make_buildings([1, 2, 3], [7, None, 12])
+
+    PreProcessingService.impute_storeys(gdf, "object_id")
+
+    assert gdf.loc[0, "storeys_count"] == 7
+    assert gdf.loc[2, "storeys_count"] == 12
+    assert 2 <= gdf.loc[1, "storeys_count"] <= 5
+
+
+def test_median_imputation_uses_known_storeys():
+    gdf = make_buildings([1, 2, 3, 4, 5], [4, None, 6, 9, None])
+
+    PreProcessingService.impute_storeys(gdf, "median")
+
+    assert gdf["storeys_count"].tolist() == [4, 6, 6, 9, 6]
+
+
+def test_median_imputation_without_known_storeys_uses_default():
+    gdf = make_buildings([1, 2], [None, None])
+
+    PreProcessingService.impute_storeys(gdf, "median")
+
+    assert gdf["storeys_count"].tolist() == [PreProcessingService.DEFAULT_STOREYS] * 2
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError, match="storeys imputation"):
+        PreProcessingService(None, storeys_imputation="random")
+
+
+@pytest.mark.parametrize(
+    "ids",
+    [
+        [5.0, 6.0, float("nan")],
+        ["5", "6", None],
+        pd.array([5, 6, None], dtype="Int64"),
+        [5, 6, None],
+    ],
+)
+def test_object_id_imputation_does_not_depend_on_id_dtype(ids):
+    reference = PreProcessingService.impute_storeys(
+        make_buildings([5, 6, 7], [None, None, 4]), "object_id"
+    )
+
+    gdf = PreProcessingService.impute_storeys(
+        make_buildings(ids, [None, None, None]), "object_id"
+    )
+
+    assert gdf["storeys_count"].iloc[:2].tolist() == reference["storeys_count"].iloc[:2].tolist()
+    assert 2 <= gdf["storeys_count"].iloc[2] <= 5
@@ -0,0 +1,44 @@
+import asyncio
+
+import geopandas as gpd
+import pytest
+from shapely import Point
+
+from landuse_app.logic.helpers.preprocessing_service import PreProcessingService
+
+
+class OutOfOrderPages:
+    """Yields territory pages in the order their downloads complete, not by page number."""
+
+    def __init__(self, pages: list[tuple[int, list[dict]]]):
+        self.pages = pages
+
+    async def iter_physical_objects_from_territory_pages(self, territory_id: int):
+        for page in self.pages:
+            await asyncio.sleep(0)
+            yield page
+
+
+def parse_page(objects: list[dict]) -> tuple[gpd.GeoDataFrame, dict[str, int]]:
+    chunk = gpd.GeoDataFrame(
+        {"physical_object_id": [obj["physical_object_id"] for obj in objects]},
+        geometry=[Point(0, 0)] * len(objects),
+        crs="EPSG:4326",
+    )
+    return chunk, {"invalid": 0, "repaired": 0, "dropped": 0, "type_changed": 0}
+
+
+@pytest.mark.asyncio
+async def test_pipelined_pages_are_returned_in_page_order(monkeypatch):
+    pages = [
+        (3, [{"physical_object_id": 5}, {"physical_object_id": 6}]),
+        (1, [{"physical_object_id": 1}, {"physical_object_id": 2}]),
+        (2, [{"physical_object_id": 3}, {"physical_object_id": 4}]),
+    ]
+    monkeypatch.setattr(PreProcessingService, "_parse_physical_objects_page", staticmethod(parse_page))
+    service = PreProcessingService(OutOfOrderPages(pages), pipeline_queue_size=1)
+
+    chunks = await service._parse_territory_pages_pipelined(1)
+
+    ids = [i for chunk in chunks for i in chunk["physical_object_id"]]
+    assert ids == [1, 2, 3, 4, 5, 6]
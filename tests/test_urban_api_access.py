@@ -0,0 +1,45 @@
+import pytest
+
+from landuse_app.logic.api.paginator import AdaptivePaginator
+from landuse_app.logic.helpers.urban_api_access import UrbanAPIAccess
+
+
+def test_streaming_is_off_when_unset(strict_config):
+    assert not UrbanAPIAccess(None, strict_config()).stream_responses
+
+
+def test_streaming_flag(strict_config):
+    assert UrbanAPIAccess(None, strict_config(STREAM_LARGE_RESPONSES="true")).stream_responses
+
+
+class CitiesHandler:
+    """Serves `total` cities page by page and records the query parameters of every request."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.requests = []
+
+    async def get(self, endpoint: str, params: dict = None) -> dict:
+        self.requests.append((endpoint, params))
+        start = (params["page"] - 1) * params["page_size"]
+        stop = min(start + params["page_size"], self.total)
+        return {
+            "count": self.total,
+            "results": [{"territory_id": i, "target_city_type": None} for i in range(start, stop)],
+        }
+
+
+@pytest.mark.asyncio
+async def test_target_cities_are_fetched_through_paginator(strict_config):
+    handler = CitiesHandler(total=25)
+    paginator = AdaptivePaginator(handler, default_page_size=10, min_page_size=10)
+    urban_api = UrbanAPIAccess(handler, strict_config(), paginator)
+
+    cities = await urban_api.get_target_cities(7)
+
+    assert [city["territory_id"] for city in cities] == list(range(25))
+    assert len(handler.requests) == 3
+    for endpoint, params in handler.requests:
+        assert endpoint == "/api/v1/all_territories_without_geometry"
+        assert params["parent_id"] == 7
+        assert params["cities_only"] == "true"